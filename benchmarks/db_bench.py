@@ -0,0 +1,84 @@
+"""
+Database round-trip benchmark against the in-process Supabase stand-in.
+
+Seeds utils/fake_supabase.py with synthetic content and posts, then times
+the Database calls the poster, scraper and reports make. With a latency
+per request the timings approximate a real Supabase connection, so changes
+that add or remove round-trips show up directly.
+
+Usage:
+    python -m benchmarks.db_bench [--content N] [--posts N] [--latency MS]
+"""
+import os
+import sys
+import time
+import random
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["SUPABASE_URL"] = "memory://"
+
+import utils.database as database
+from utils.database import Database, CONTENT_STATUSES, POST_LANGUAGES
+from config.settings import TIER_1_COUNTRIES
+
+NICHES = ["politics", "business", "tech", "entertainment", "sports"]
+
+
+def seed(client, content_count, post_count):
+    now = datetime.utcnow()
+    countries = [c["code"] for c in TIER_1_COUNTRIES]
+    client.insert_rows("content", [{
+        "headline": f"Synthetic headline {i}",
+        "original_url": f"https://example.com/story/{i}",
+        "image_url": f"https://example.com/img/{i}.jpg",
+        "source_language": random.choice(POST_LANGUAGES),
+        "country_code": random.choice(countries),
+        "niche": random.choice(NICHES),
+        "status": random.choice(CONTENT_STATUSES),
+        "created_at": (now - timedelta(hours=random.uniform(0, 96))).isoformat(),
+    } for i in range(content_count)])
+    client.insert_rows("posts", [{
+        "content_id": i,
+        "post_language": random.choice(POST_LANGUAGES),
+        "target_country": random.choice(countries),
+        "niche": random.choice(NICHES),
+        "image_used": f"https://example.com/img/{i}.jpg",
+        "facebook_post_id": f"fb_{i}",
+        "reach": random.randint(0, 5000),
+        "posted_at": (now - timedelta(hours=random.uniform(0, 24 * 14))).isoformat(),
+    } for i in range(post_count)])
+
+
+def timed(client, label, fn):
+    before = client.round_trips
+    started = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"  {label:<28} {elapsed:>9.1f} ms  {client.round_trips - before:>4} round-trips")
+
+
+def main(argv):
+    content_count = int(argv[argv.index("--content") + 1]) if "--content" in argv else 5000
+    post_count = int(argv[argv.index("--posts") + 1]) if "--posts" in argv else 2000
+    latency = float(argv[argv.index("--latency") + 1]) if "--latency" in argv else 0
+
+    db = Database()
+    client = database.get_client()
+    seed(client, content_count, post_count)
+    client.latency = latency / 1000.0
+    week_ago = (datetime.utcnow() - timedelta(days=7)).isoformat()
+
+    print(f"{content_count} content rows, {post_count} posts, {latency:g} ms latency per request\n")
+    timed(client, "get_dashboard_stats", db.get_dashboard_stats)
+    timed(client, "count pending", lambda: db.count("content", status="pending"))
+    timed(client, "get_language_ratio", db.get_language_ratio)
+    timed(client, "claim_content", lambda: db.claim_content(niche="politics"))
+    timed(client, "is_image_used", lambda: db.is_image_used("https://example.com/img/unused.jpg"))
+    timed(client, "get_posts_since (7 days)", lambda: sum(1 for _ in db.get_posts_since(week_ago)))
+    timed(client, "cleanup_old_content", lambda: db.cleanup_old_content(hours=48, archive=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
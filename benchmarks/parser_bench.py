@@ -0,0 +1,271 @@
+"""
+Parser benchmark over recorded HTML fixtures.
+
+Times parse_articles, the article-page extractors and the unified body
+extractor (speed, and quality against JSON-LD/meta text) for every web scraper
+(SCRAPER_MAP classes, declarative specs and GenericScraper) against stored
+pages, reporting time per page, articles extracted and peak memory, and
+compares the results to a stored baseline.
+
+Usage:
+    python -m benchmarks.parser_bench record [source name ...]
+    python -m benchmarks.parser_bench run [--repeat N] [--timings] [--tolerance 0.25]
+    python -m benchmarks.parser_bench baseline
+    python -m pytest benchmarks --benchmark-only   (needs pytest-benchmark)
+
+Fixtures live in benchmarks/fixtures/<source-slug>/ as homepage.html,
+article_<n>.html and source.json (the sources row used to build the scraper).
+One is committed for every SCRAPER_MAP web scraper and declarative spec,
+plus KOACI through GenericScraper, together with baseline.json, so `run`
+works out of the box. If the fixtures folder is empty, `run` records
+fixtures first, which needs network access and the Supabase credentials.
+
+`run` fails on fewer articles, images, bodies or lower body quality than
+the baseline. Timings are printed but only gated with --timings, on the
+machine that wrote the baseline. Politeness sleeps in parse_articles are
+skipped while measuring.
+"""
+import os
+import re
+import sys
+import json
+import time
+import tracemalloc
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.scraper_manager import SCRAPER_MAP, get_scraper
+from scrapers.declarative_scraper import load_specs
+from scrapers.generic_scraper import GenericScraper
+from scrapers.body_extractor import extract_body, body_quality
+from utils.structured_data import extract_article_metadata
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+ARTICLE_PAGES = 3
+API_SOURCES = ["GNews", "YouTube", "NewsAPI", "Google Trends"]
+
+
+def slugify(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def web_scraper_names():
+    """Every source name that has its own scraper or declarative spec"""
+    names = [name for name in SCRAPER_MAP if name not in API_SOURCES]
+    names += [name for name in load_specs() if name not in names]
+    return names
+
+
+def load_fixture(slug):
+    folder = os.path.join(FIXTURES_DIR, slug)
+    with open(os.path.join(folder, "source.json"), "r", encoding="utf-8") as f:
+        source = json.load(f)
+    with open(os.path.join(folder, "homepage.html"), "r", encoding="utf-8") as f:
+        homepage = f.read()
+    articles = []
+    for filename in sorted(os.listdir(folder)):
+        if filename.startswith("article_") and filename.endswith(".html"):
+            with open(os.path.join(folder, filename), "r", encoding="utf-8") as f:
+                articles.append(f.read())
+    return source, homepage, articles
+
+
+def list_fixtures():
+    if not os.path.isdir(FIXTURES_DIR):
+        return []
+    return sorted(
+        d for d in os.listdir(FIXTURES_DIR)
+        if os.path.isfile(os.path.join(FIXTURES_DIR, d, "source.json"))
+    )
+
+
+def measure(func, repeat):
+    """Return (seconds per call, peak bytes, last result)"""
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    return elapsed, peak, result
+
+
+def bench_source(slug, repeat):
+    source, homepage, article_pages = load_fixture(slug)
+    scraper = get_scraper(source)
+    row = {"scraper": type(scraper).__name__}
+
+    elapsed, peak, articles = measure(lambda: scraper.parse_articles(homepage), repeat)
+    row["parse_ms"] = round(elapsed * 1000, 3)
+    row["parse_peak_kb"] = round(peak / 1024, 1)
+    row["articles"] = len(articles or [])
+    row["with_image"] = sum(1 for a in articles or [] if a.get("image"))
+
+    if article_pages:
+        def extract_all():
+            return [scraper.extract_full_details(html) for html in article_pages]
+        elapsed, peak, details = measure(extract_all, repeat)
+        row["details_ms"] = round(elapsed * 1000 / len(article_pages), 3)
+        row["details_peak_kb"] = round(peak / 1024, 1)
+        row["details_with_body"] = sum(1 for text, _ in details if text)
+
+        generic = GenericScraper(source["id"], source["name"], source["url"], source["country"],
+                                 source["country_code"], source["language"], source["niche"])
+        def content_all():
+            return [generic.extract_article_content(html) for html in article_pages]
+        elapsed, peak, contents = measure(content_all, repeat)
+        row["content_ms"] = round(elapsed * 1000 / len(article_pages), 3)
+        row["content_peak_kb"] = round(peak / 1024, 1)
+        row["content_found"] = sum(1 for c in contents if c)
+
+        def bodies_all():
+            return [extract_body(html) for html in article_pages]
+        elapsed, peak, bodies = measure(bodies_all, repeat)
+        row["body_ms"] = round(elapsed * 1000 / len(article_pages), 3)
+        row["body_peak_kb"] = round(peak / 1024, 1)
+        row["body_chars"] = sum(len(body) for body, _ in bodies) // len(article_pages)
+        scores = [body_quality(body, reference_text(html, page_meta))
+                  for html, (body, page_meta) in zip(article_pages, bodies)]
+        scores = [q for q in scores if q is not None]
+        if scores:
+            row["body_quality"] = round(sum(scores) / len(scores), 3)
+
+    return row
+
+
+def reference_text(html, page_meta):
+    """What a correct body should cover: JSON-LD articleBody, else the meta description"""
+    meta = extract_article_metadata(html)
+    if meta and meta["body"]:
+        return meta["body"]
+    return page_meta.get("og:description") or page_meta.get("description") or ""
+
+
+def run(repeat=5):
+    results = {}
+    # AllAfrica sleeps between items; measure the parsing, not the delay
+    with mock.patch("time.sleep"):
+        for slug in list_fixtures():
+            try:
+                results[slug] = bench_source(slug, repeat)
+            except Exception as e:
+                results[slug] = {"error": str(e)}
+    return results
+
+
+def compare(results, baseline, tolerance, timings=False):
+    """Return human-readable regressions against the baseline (timings only if asked)"""
+    regressions = []
+    for slug, row in results.items():
+        base = baseline.get(slug)
+        if not base or "error" in row:
+            continue
+        for key in ("parse_ms", "details_ms", "content_ms", "body_ms") if timings else ():
+            if key in row and key in base and row[key] > base[key] * (1 + tolerance):
+                regressions.append(f"{slug}: {key} {base[key]} -> {row[key]}")
+        for key in ("articles", "with_image", "details_with_body", "content_found", "body_quality"):
+            if key in row and key in base and row[key] < base[key]:
+                regressions.append(f"{slug}: {key} {base[key]} -> {row[key]}")
+    return regressions
+
+
+def print_results(results):
+    print(f"{'Source':<22} | {'Scraper':<20} | {'Parse ms':>9} | {'Peak KB':>8} | {'Articles':>8} | "
+          f"{'Body ms':>8} | {'Quality':>7}")
+    print("-" * 100)
+    for slug, row in results.items():
+        if "error" in row:
+            print(f"{slug:<22} | ERROR: {row['error'][:60]}")
+            continue
+        print(f"{slug:<22} | {row['scraper']:<20} | {row['parse_ms']:>9} | {row['parse_peak_kb']:>8} | "
+              f"{row['articles']:>8} | {row.get('body_ms', '-'):>8} | {row.get('body_quality', '-'):>7}")
+
+
+def record(names=None):
+    """Fetch homepages and a few article pages for each source into fixtures"""
+    from utils.database import Database
+    from utils.http_helper import fetch_page
+
+    wanted = set(names or web_scraper_names())
+    active = Database().get_active_sources()
+    sources = [s for s in active if s["name"] in wanted]
+    if not names:
+        # One source without a dedicated scraper exercises GenericScraper
+        generic = [s for s in active if s["name"] not in wanted and s["name"] not in API_SOURCES]
+        sources += generic[:1]
+
+    for source in sources:
+        homepage = fetch_page(source["url"])
+        if not homepage:
+            print(f"  {source['name']}: fetch failed")
+            continue
+        folder = os.path.join(FIXTURES_DIR, slugify(source["name"]))
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, "source.json"), "w", encoding="utf-8") as f:
+            json.dump(source, f, indent=2, default=str)
+        with open(os.path.join(folder, "homepage.html"), "w", encoding="utf-8") as f:
+            f.write(homepage)
+
+        articles = get_scraper(source).parse_articles(homepage) or []
+        saved = 0
+        for article in articles:
+            if saved >= ARTICLE_PAGES:
+                break
+            html = fetch_page(article.get("url", ""))
+            if html:
+                saved += 1
+                with open(os.path.join(folder, f"article_{saved}.html"), "w", encoding="utf-8") as f:
+                    f.write(html)
+        print(f"  {source['name']}: homepage + {saved} article pages")
+
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else "run"
+    repeat = int(argv[argv.index("--repeat") + 1]) if "--repeat" in argv else 5
+    tolerance = float(argv[argv.index("--tolerance") + 1]) if "--tolerance" in argv else 0.25
+    timings = "--timings" in argv
+
+    if command == "record":
+        record(argv[2:] or None)
+        return 0
+
+    if not list_fixtures():
+        print("No fixtures found, recording them first...")
+        record()
+        if not list_fixtures():
+            print("Recording failed. Check network access and SUPABASE_URL/SUPABASE_KEY")
+            return 1
+
+    results = run(repeat)
+    print_results(results)
+
+    if command == "baseline":
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("\nNo baseline yet. Create one with: python -m benchmarks.parser_bench baseline")
+        return 0
+
+    with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, tolerance, timings)
+    if regressions:
+        print("\nREGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,30 @@
+"""
+pytest-benchmark entry point over the same fixtures as parser_bench:
+    python -m pytest benchmarks --benchmark-only
+Skipped when pytest-benchmark is not installed.
+"""
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmarks.parser_bench import list_fixtures, load_fixture
+from scrapers.scraper_manager import get_scraper
+from scrapers.body_extractor import extract_body
+
+
+@pytest.mark.parametrize("slug", list_fixtures())
+def test_parse_articles(benchmark, slug):
+    source, homepage, _ = load_fixture(slug)
+    scraper = get_scraper(source)
+    with mock.patch("time.sleep"):
+        articles = benchmark(scraper.parse_articles, homepage)
+    assert articles
+
+
+@pytest.mark.parametrize("slug", list_fixtures())
+def test_extract_body(benchmark, slug):
+    _, _, article_pages = load_fixture(slug)
+    bodies = benchmark(lambda: [extract_body(html) for html in article_pages])
+    assert all(body for body, _ in bodies)
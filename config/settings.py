@@ -10,6 +10,8 @@ FB_BASE_URL = f"https://graph.facebook.com/{FB_API_VERSION}"
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+# Direct Postgres connection string, only needed for `python main.py migrate`
+DATABASE_URL = os.getenv("DATABASE_URL")
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
@@ -27,6 +29,15 @@ YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
+# Optional SQLite mirror of recent posts and used images (utils/local_mirror.py).
+# Empty disables it; reads are re-synced at most every LOCAL_MIRROR_MAX_AGE seconds.
+LOCAL_MIRROR_PATH = os.getenv("LOCAL_MIRROR_PATH", "")
+LOCAL_MIRROR_MAX_AGE = int(os.getenv("LOCAL_MIRROR_MAX_AGE", "60"))
+
+# Content from the last DEDUP_WINDOW_DAYS is fingerprinted for dedup (utils/dedup_index.py);
+# older duplicates are rejected by the unique indexes in migrations/005_query_indexes.sql.
+DEDUP_WINDOW_DAYS = int(os.getenv("DEDUP_WINDOW_DAYS", "30"))
+
 LANGUAGE_SPLIT = {"french": 0.70, "english": 0.30}
 
 NICHE_SPLIT = {"politics": 0.35, "business": 0.25, "tech": 0.20, "entertainment": 0.15, "sports": 0.05}
@@ -56,4 +67,46 @@ TIER_2_COUNTRIES = [
 ]
 
 IMAGE_WIDTH = 1200
-IMAGE_HEIGHT = 630
\ No newline at end of file
+IMAGE_HEIGHT = 630
+
+# Extra keywords (lowercase) for country tagging beyond the tier names above
+COUNTRY_ALIASES = {
+    "congo": ("DRC", "CD"),
+    "rdc": ("DRC", "CD"),
+    "kinshasa": ("DRC", "CD"),
+    "côte d'ivoire": ("Ivory Coast", "CI"),
+    "abidjan": ("Ivory Coast", "CI"),
+    "burkina": ("Burkina Faso", "BF"),
+    "ouagadougou": ("Burkina Faso", "BF"),
+    "bamako": ("Mali", "ML"),
+    "guinée": ("Guinea", "GN"),
+    "conakry": ("Guinea", "GN"),
+    "nigéria": ("Nigeria", "NG"),
+    "lagos": ("Nigeria", "NG"),
+    "afrique du sud": ("South Africa", "ZA"),
+    "sénégal": ("Senegal", "SN"),
+    "dakar": ("Senegal", "SN"),
+    "cameroun": ("Cameroon", "CM"),
+    "maroc": ("Morocco", "MA"),
+    "éthiopie": ("Ethiopia", "ET"),
+    "tanzanie": ("Tanzania", "TZ"),
+    "ouganda": ("Uganda", "UG"),
+    "algérie": ("Algeria", "DZ"),
+    "nairobi": ("Kenya", "KE"),
+    "bujumbura": ("Burundi", "BI"),
+    "egypt": ("Egypt", "EG"),
+    "égypte": ("Egypt", "EG"),
+}
+
+NICHE_KEYWORDS = {
+    "politics": ["election", "élection", "president", "président", "government", "gouvernement",
+                 "minister", "ministre", "parliament", "parlement", "opposition", "coup", "military"],
+    "business": ["economy", "économie", "business", "bank", "banque", "investment", "investissement",
+                 "market", "marché", "inflation", "trade", "commerce", "budget"],
+    "tech": ["tech", "startup", "digital", "numérique", "internet", "mobile money", "fintech",
+             "artificial intelligence", "intelligence artificielle", "telecom"],
+    "entertainment": ["music", "musique", "film", "cinema", "cinéma", "concert", "artist", "artiste",
+                      "album", "celebrity", "nollywood", "festival"],
+    "sports": ["football", "match", "can 2025", "afcon", "league", "ligue", "coach", "entraîneur",
+               "goal", "athletics", "athlétisme"],
+}
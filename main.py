@@ -8,6 +8,8 @@ from processors.scraper_runner import scraper_runner
 from processors.telegram_reporter import telegram_reporter
 from utils.database import Database
 from utils.fb_analytics import fb_analytics
+from utils.migrations import migrate
+from config.settings import DATABASE_URL
 from utils.logger import log_info, log_error, log_success
 
 class AfricaLensBot:
@@ -21,25 +23,21 @@ class AfricaLensBot:
     def show_status(self):
         """Show current bot status"""
         try:
-            pending_result = self.db.client.table("content").select("id").eq("status", "pending").execute()
-            pending = len(pending_result.data) if pending_result.data else 0
-            
-            today = datetime.utcnow().date().isoformat()
-            posts_result = self.db.client.table("posts").select("id").gte("posted_at", today).execute()
-            posted_today = len(posts_result.data) if posts_result.data else 0
-            
-            french_result = self.db.client.table("posts").select("id").gte("posted_at", today).eq("post_language", "french").execute()
-            english_result = self.db.client.table("posts").select("id").gte("posted_at", today).eq("post_language", "english").execute()
-            french_count = len(french_result.data) if french_result.data else 0
-            english_count = len(english_result.data) if english_result.data else 0
+            stats = self.db.get_dashboard_stats()
+            by_language = stats["posts_by_language"]
             
             print("="*50)
             print("AFRICA LENS BOT STATUS")
             print("="*50)
-            print(f"Pending content: {pending}")
-            print(f"Posts today: {posted_today}")
-            print(f"  - French: {french_count}")
-            print(f"  - English: {english_count}")
+            print(f"Pending content: {stats['pending']}")
+            print(f"Posts today: {stats['posts_today']}")
+            print(f"  - French: {by_language.get('french', 0)}")
+            print(f"  - English: {by_language.get('english', 0)}")
+            for status, count in stats["content_by_status"].items():
+                print(f"Content {status}: {count}")
+            stuck = self.db.stale_posting_content()
+            if stuck:
+                print(f"Stuck in posting (check Facebook): {', '.join(str(row['id']) for row in stuck)}")
             print(f"Current time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M')}")
             print("="*50)
             
@@ -60,6 +58,7 @@ class AfricaLensBot:
         """Clean up old content"""
         log_info(f"Cleaning up content older than {hours} hours...")
         try:
+            self.db.reap_stale_posting()
             count = self.db.cleanup_old_content(hours=hours)
             log_success(f"Cleanup complete. Removed {count} old records.")
             return count
@@ -67,6 +66,18 @@ class AfricaLensBot:
             log_error(f"Error during cleanup: {e}")
             return 0
     
+    def run_migrations(self, url=None):
+        """Apply pending schema migrations from migrations/"""
+        url = url or DATABASE_URL
+        if not url:
+            log_error("Set DATABASE_URL (or pass a postgres:// or sqlite:/// URL) to run migrations")
+            return []
+        try:
+            return migrate(url)
+        except Exception as e:
+            log_error(f"Migration failed: {e}")
+            return []
+    
     def update_analytics(self):
         """Update analytics for recent posts"""
         log_info("Updating analytics...")
@@ -123,7 +134,7 @@ if __name__ == "__main__":
     bot = AfricaLensBot()
     
     if len(sys.argv) < 2:
-        print("Usage: python main.py [status|post|scrape|run|report|analytics|cleanup]")
+        print("Usage: python main.py [status|post|scrape|run|report|analytics|cleanup|migrate]")
         print("\nCommands:")
         print("  status    - Show current bot status")
         print("  post      - Run a single post cycle")
@@ -132,6 +143,7 @@ if __name__ == "__main__":
         print("  run       - Run in continuous mode")
         print("  report    - Send daily report")
         print("  analytics - Show analytics report")
+        print("  migrate   - Apply schema migrations (DATABASE_URL or a given URL)")
         sys.exit(1)
     
     command = sys.argv[1].lower()
@@ -152,6 +164,8 @@ if __name__ == "__main__":
         print("Report sent (if Telegram configured)")
     elif command == "analytics":
         bot.show_analytics()
+    elif command == "migrate":
+        bot.run_migrations(sys.argv[2] if len(sys.argv) > 2 else None)
     else:
         print(f"Unknown command: {command}")
-        print("Available commands: status, post, scrape, cleanup, run, report, analytics")
\ No newline at end of file
+        print("Available commands: status, post, scrape, cleanup, run, report, analytics, migrate")
\ No newline at end of file
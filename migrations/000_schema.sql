@@ -0,0 +1,77 @@
+-- Base tables. Safe on an existing database: tables are only created when
+-- missing and later-added columns are added if absent.
+
+create table if not exists sources (
+    id bigint generated by default as identity primary key,
+    name text not null,
+    url text not null,
+    source_type text default 'scrape',
+    country text,
+    country_code text,
+    language text,
+    niche text,
+    priority integer default 1,
+    is_active boolean default true,
+    last_scraped timestamptz,
+    learned_selectors jsonb,
+    feed_url text,
+    scraper_spec jsonb,
+    max_pages integer,
+    created_at timestamptz default now()
+);
+
+create table if not exists content (
+    id bigint generated by default as identity primary key,
+    source_id bigint references sources(id) on delete set null,
+    headline text not null,
+    summary text,
+    original_url text,
+    image_url text,
+    initial_image_url text,
+    source_language text,
+    country text,
+    country_code text,
+    niche text,
+    status text not null default 'pending',
+    headline_hash text,
+    claimed_by text,
+    claimed_until timestamptz,
+    created_at timestamptz default now(),
+    updated_at timestamptz default now()
+);
+
+create table if not exists posts (
+    id bigint generated by default as identity primary key,
+    content_id bigint,
+    post_text text,
+    post_language text,
+    target_country text,
+    niche text,
+    image_used text,
+    facebook_post_id text,
+    posted_at timestamptz default now(),
+    reach integer default 0,
+    impressions integer default 0,
+    engagements integer default 0,
+    reactions integer default 0,
+    comments integer default 0,
+    shares integer default 0,
+    metrics_updated_at timestamptz
+);
+
+create table if not exists schedule (
+    id bigint generated by default as identity primary key,
+    hour_utc integer not null,
+    target_country text,
+    target_language text,
+    target_niche text,
+    is_active boolean default true
+);
+
+alter table sources add column if not exists learned_selectors jsonb;
+alter table sources add column if not exists feed_url text;
+alter table sources add column if not exists scraper_spec jsonb;
+alter table sources add column if not exists max_pages integer;
+alter table content add column if not exists claimed_by text;
+alter table content add column if not exists claimed_until timestamptz;
+alter table posts add column if not exists metrics_updated_at timestamptz;
@@ -0,0 +1,21 @@
+-- postgres-only
+-- Dashboard counters in one round-trip (Database.get_dashboard_stats)
+create or replace function dashboard_stats(since timestamptz)
+returns json
+language sql
+stable
+as $$
+    select json_build_object(
+        'pending', (select count(*) from content where status = 'pending'),
+        'posts_today', (select count(*) from posts where posted_at >= since),
+        'posts_by_language', coalesce((
+            select json_object_agg(post_language, n)
+            from (select post_language, count(*) as n from posts
+                  where posted_at >= since group by post_language) t
+        ), '{}'::json),
+        'content_by_status', coalesce((
+            select json_object_agg(status, n)
+            from (select status, count(*) as n from content group by status) t
+        ), '{}'::json)
+    );
+$$;
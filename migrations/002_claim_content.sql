@@ -0,0 +1,31 @@
+-- postgres-only
+-- Leased, concurrent-safe content claiming (Database.claim_content)
+alter table content add column if not exists claimed_by text;
+alter table content add column if not exists claimed_until timestamptz;
+
+create or replace function claim_content(
+    worker text,
+    lease_seconds integer default 600,
+    p_country_code text default null,
+    p_language text default null,
+    p_niche text default null
+)
+returns setof content
+language sql
+as $$
+    update content c
+    set claimed_by = worker,
+        claimed_until = now() + make_interval(secs => lease_seconds)
+    where c.id = (
+        select id from content
+        where status = 'pending'
+          and (claimed_until is null or claimed_until < now())
+          and (p_country_code is null or country_code = p_country_code)
+          and (p_language is null or source_language = p_language)
+          and (p_niche is null or niche = p_niche)
+        order by id desc
+        limit 1
+        for update skip locked
+    )
+    returning c.*;
+$$;
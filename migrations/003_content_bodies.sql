@@ -0,0 +1,6 @@
+-- Full article text kept out of content so list reads stay small
+-- (Database.add_content / get_content_body)
+create table if not exists content_bodies (
+    content_id bigint primary key references content(id) on delete cascade,
+    body text not null
+);
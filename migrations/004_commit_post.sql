@@ -0,0 +1,38 @@
+-- postgres-only
+-- Record a published post and mark its content posted in one transaction
+-- (Database.commit_post). Idempotent on facebook_post_id.
+create unique index if not exists posts_facebook_post_id_key on posts (facebook_post_id);
+
+create or replace function commit_post(
+    p_content_id bigint,
+    p_post_text text,
+    p_post_language text,
+    p_target_country text,
+    p_niche text,
+    p_image_used text,
+    p_facebook_post_id text
+)
+returns posts
+language plpgsql
+as $$
+declare
+    result posts;
+begin
+    insert into posts (content_id, post_text, post_language, target_country, niche,
+                       image_used, facebook_post_id, posted_at)
+    values (p_content_id, p_post_text, p_post_language, p_target_country, p_niche,
+            p_image_used, p_facebook_post_id, now())
+    on conflict (facebook_post_id) do nothing
+    returning * into result;
+
+    if result.id is null then
+        select * into result from posts where facebook_post_id = p_facebook_post_id;
+    end if;
+
+    update content
+    set status = 'posted', claimed_by = null, claimed_until = null
+    where id = p_content_id;
+
+    return result;
+end;
+$$;
@@ -0,0 +1,23 @@
+-- Indexes for the filters the bot runs on every cycle. The unique indexes
+-- back dedup (add_content) and will fail if duplicates already exist;
+-- remove those rows first.
+
+-- claim_content / dashboard counts
+create index if not exists content_status_country_niche_idx on content (status, country_code, niche);
+-- claim_content walks pending rows newest first, checking the lease from the index
+create index if not exists content_pending_claim_idx on content (id, claimed_until) where status = 'pending';
+-- content_exists / url_exists / existing_urls
+create unique index if not exists content_headline_hash_key on content (headline_hash);
+create unique index if not exists content_original_url_key on content (original_url);
+-- cleanup_old_content and the local mirror's delta sync
+create index if not exists content_created_at_idx on content (created_at);
+
+-- get_posts_since, language ratio, reports
+create index if not exists posts_posted_at_idx on posts (posted_at);
+-- is_image_used
+create index if not exists posts_image_used_idx on posts (image_used);
+-- commit_post idempotency and metrics updates
+create unique index if not exists posts_facebook_post_id_key on posts (facebook_post_id);
+
+-- schedule slots
+create index if not exists schedule_hour_idx on schedule (hour_utc);
@@ -0,0 +1,8 @@
+-- content.updated_at: watermark for the local mirror's delta sync
+-- (utils/local_mirror.py). Set by every write in utils/database.py and,
+-- on Postgres, by the trigger in 007.
+alter table content add column if not exists updated_at timestamptz;
+
+update content set updated_at = created_at where updated_at is null;
+
+create index if not exists content_updated_at_idx on content (updated_at);
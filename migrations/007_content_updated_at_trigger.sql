@@ -0,0 +1,17 @@
+-- postgres-only
+-- Keep content.updated_at current for writes made inside database
+-- functions (claim_content, commit_post) and by hand.
+create or replace function set_content_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at = now();
+    return new;
+end;
+$$;
+
+drop trigger if exists content_set_updated_at on content;
+create trigger content_set_updated_at
+    before insert or update on content
+    for each row execute function set_content_updated_at();
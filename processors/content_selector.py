@@ -3,7 +3,6 @@ from utils.database import Database
 db = Database()
 from utils.logger import log_info, log_warning
 from config.settings import LANGUAGE_SPLIT
-import random
 
 class ContentSelector:
     def __init__(self):
@@ -42,38 +41,26 @@ class ContentSelector:
         # Try to find content matching criteria
         country_code = self._get_country_code(target_country)
         
+        # Each attempt leases the item to this worker, so parallel posters never share one
         # First try: exact match
-        content = db.get_pending_content(
-            country_code=country_code,
-            niche=target_niche,
-            limit=5
-        )
+        selected = db.claim_content(country_code=country_code, niche=target_niche)
         
         # Second try: just country
-        if not content and country_code:
-            content = db.get_pending_content(
-                country_code=country_code,
-                limit=5
-            )
+        if not selected and country_code:
+            selected = db.claim_content(country_code=country_code)
         
         # Third try: just niche
-        if not content and target_niche:
-            content = db.get_pending_content(
-                niche=target_niche,
-                limit=5
-            )
+        if not selected and target_niche:
+            selected = db.claim_content(niche=target_niche)
         
         # Fourth try: any pending content
-        if not content:
-            content = db.get_pending_content(limit=10)
+        if not selected:
+            selected = db.claim_content()
         
-        if not content:
+        if not selected:
             log_warning("No pending content available")
             return None, None
         
-        # Pick one randomly from top results
-        selected = random.choice(content[:min(3, len(content))])
-        
         log_info(f"Selected: [{selected['country']}] {selected['headline'][:50]}...")
         log_info(f"Output language: {output_language}")
         
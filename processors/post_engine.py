@@ -12,6 +12,7 @@ class PostEngine:
         self.fb = fb_poster
         self.selector = content_selector
         self.MAX_RETRIES = 20  # How many articles to check for valid images before giving up
+        self.COMMIT_RETRIES = 3  # Attempts to record a post that is already live
 
     def run_single_post(self, schedule=None):
         """Run a single post cycle with retries for valid images"""
@@ -36,8 +37,8 @@ class PostEngine:
             log_info(f"Attempt {attempts}/{self.MAX_RETRIES} to find content with valid image...")
 
             # Select content based on schedule
-            # Note: The selector fetches 'pending' content. Since we mark bad content 
-            # as 'skipped_no_image' inside this loop, the next iteration will fetch different content.
+            # Note: The selector leases 'pending' content to this worker. Since we mark bad content 
+            # as 'skipped_no_image' inside this loop, the next iteration will claim different content.
             result = self.selector.select_content(schedule)
             
             if not result or (isinstance(result, tuple) and not result[0]):
@@ -81,10 +82,13 @@ class PostEngine:
             # Determine output language
             output_language = suggested_language or schedule.get('target_language') or content.get('source_language', 'french')
             
+            # Selection only carries light columns; fetch the text for the chosen item
+            summary = self.db.get_content_body(content['id'])
+            
             # Generate post with AI
             post_text = self.ai.generate_post(
                 headline=content.get('headline', ''),
-                summary=content.get('summary', ''),
+                summary=summary,
                 output_language=output_language,
                 country=country,
                 niche=niche
@@ -95,15 +99,17 @@ class PostEngine:
                 self.db.mark_content_failed(content['id'])
                 continue # Try next article
             
-            # Mark content as posted BEFORE posting to prevent duplicates
-            self.db.mark_content_posted(content['id'])
+            # Out of pending before the live post: claims and cleanup leave 'posting' rows alone
+            if not self.db.mark_content_posting(content['id']):
+                log_warning(f"Content {content['id']} is no longer leased to this worker. Skipping.")
+                continue
             
             # Post to Facebook (Strict mode: will fail if image fails upload)
             post_result = self.fb.post(post_text, cleaned_url, country=country, niche=niche)
             
             if post_result:
-                # Save to posts table
-                self.db.create_post(
+                # Save the post and mark content posted in one transaction
+                self._record_post(
                     content_id=content['id'],
                     post_text=post_text,
                     post_language=output_language,
@@ -124,6 +130,21 @@ class PostEngine:
         log_warning("Max retries reached. Could not find valid content with images.")
         return False
     
+    def _record_post(self, **post):
+        """commit_post with backoff; it is idempotent on facebook_post_id, so retrying is safe"""
+        for attempt in range(1, self.COMMIT_RETRIES + 1):
+            try:
+                self.db.commit_post(**post)
+                return True
+            except Exception as e:
+                if attempt == self.COMMIT_RETRIES:
+                    # The post is live; content stays 'posting' so it is never posted again
+                    log_error(f"Posted {post['facebook_post_id']} but could not record it for content "
+                              f"{post['content_id']}: {e}")
+                    return False
+                log_warning(f"Recording post {post['facebook_post_id']} failed (attempt {attempt}), retrying: {e}")
+                time.sleep(2 ** attempt)
+    
     def run_scheduled_post(self):
         """Run post based on current schedule"""
         return self.run_single_post()
@@ -4,6 +4,8 @@ from scrapers.scraper_manager import get_scraper, SCRAPER_MAP
 from utils.database import Database
 from utils.http_helper import fetch_page, extract_og_image
 from utils.freshness_filter import FreshnessFilter
+from utils.structured_data import extract_article_metadata
+from utils.feed_reader import discover_feed, parse_feed
 from utils.logger import log_info, log_error, log_success, log_warning
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
@@ -81,11 +83,9 @@ class ScraperRunner:
     def _save_article(self, source, article, image_url):
         """Helper method to save article to database"""
         try:
-            headline = article.get("headline", "").strip()
-            summary = article.get("summary", "").strip()
-            url = article.get("url", "").strip()
+            headline = article.headline
             
-            if not all([headline, url]):
+            if not all([headline, article.url]):
                 log_warning("Skipping article - missing required fields (headline/URL)")
                 self.stats['skipped_other'] += 1
                 return False
@@ -95,17 +95,7 @@ class ScraperRunner:
             log_info(f"Image URL: {image_url}")
 
             # Save to database
-            success = self.db.add_content(
-                source_id=source["id"],
-                headline=headline,
-                summary=summary,
-                original_url=url,
-                image_url=image_url,
-                source_language=article.get("language", source.get("language", "en")),
-                country=article.get("country", source.get("country", "")),
-                country_code=article.get("country_code", source.get("country_code", "")),
-                niche=article.get("niche", source.get("niche", "general"))
-            )
+            success = self.db.add_article(article, image_url=image_url)
             
             if success:
                 self.stats['saved_articles'] += 1
@@ -121,6 +111,37 @@ class ScraperRunner:
             self.stats['errors'] += 1
             return False
 
+    def _save_learned_selectors(self, source, scraper):
+        """Persist which selectors worked so the next run tries them first"""
+        learned = scraper.learned_selector_update()
+        if not learned:
+            return
+        try:
+            self.db.update_source_selectors(source["id"], learned)
+        except Exception as e:
+            log_warning(f"Could not save learned selectors for {source.get('name')}: {e}")
+
+    def _read_feed(self, source, scraper, homepage_html=None):
+        """Articles from the source's feed, discovering and saving the feed URL once"""
+        feed_url = source.get("feed_url")
+        if feed_url is None:
+            if not homepage_html:
+                # Homepage unreachable: don't record "no feed" on a network blip
+                return []
+            feed_url = discover_feed(source["url"], homepage_html)
+            try:
+                self.db.update_source_feed(source["id"], feed_url)
+            except Exception as e:
+                log_warning(f"Could not save feed URL for {source.get('name')}: {e}")
+        if not feed_url:
+            return []
+        
+        data = fetch_page(feed_url, raw=True)
+        articles = [scraper.make_article(**item) for item in parse_feed(data)] if data else []
+        if articles:
+            log_info(f"Using feed for {source.get('name')}: {feed_url} ({len(articles)} articles)")
+        return articles
+
     def run_single_source(self, source):
         """Run scraper for a single source"""
         source_name = source.get("name", "Unknown")
@@ -133,18 +154,38 @@ class ScraperRunner:
             scraper = get_scraper(source)
             
             # Get articles
-            if source_name in self.api_sources or source.get("source_type") == "api":
+            html = None
+            is_api = source_name in self.api_sources or source.get("source_type") == "api"
+            if is_api:
                 try:
                     articles = scraper.parse_articles(None)
                 except Exception as e:
                     log_warning(f"API scraper {source_name} failed: {e}")
                     return 0
             else:
-                html = fetch_page(source["url"])
+                # A feed (RSS/Atom/news sitemap) is one small request; prefer it
+                if source.get("feed_url") is None:
+                    # Discovery reads the homepage; keep it for the HTML path below
+                    html = fetch_page(source["url"])
+                articles = self._read_feed(source, scraper, html)
+            
+            if not articles and not is_api:
+                html = html or fetch_page(source["url"])
                 if not html:
                     log_warning(f"Failed to fetch {source_name}")
                     return 0
-                articles = scraper.parse_articles(html)
+                # JSON-LD NewsArticle entries skip the DOM heuristics entirely
+                parse = scraper.parse_structured_articles
+                articles = parse(html)
+                if articles:
+                    log_info(f"Using structured data for {source_name} ({len(articles)} articles)")
+                else:
+                    parse = scraper.parse_articles
+                    articles = parse(html)
+                if scraper.max_pages > 1:
+                    articles = scraper.paginate(articles, html, parse, self.db.existing_urls)
+                if parse == scraper.parse_articles:
+                    self._save_learned_selectors(source, scraper)
             
             if not articles:
                 log_warning(f"No articles found for {source_name}")
@@ -162,8 +203,8 @@ class ScraperRunner:
             saved = 0
             for article in fresh_articles:
                 try:
-                    headline = article.get("headline", "").strip()
-                    url = article.get("url", "").strip()
+                    headline = article.headline
+                    url = article.url
                     
                     if not all([headline, url]):
                         log_warning("Skipping article - missing required fields (headline/URL)")
@@ -171,14 +212,17 @@ class ScraperRunner:
                         continue
                     
                     # Process image
-                    image_url = article.get("image", "").strip()
+                    image_url = article.image
                     if not image_url:
                         log_info(f"Fetching article page for image: {url[:100]}...")
                         try:
                             html = fetch_page(url)
                             if html:
-                                # Try OpenGraph first
-                                image_url = extract_og_image(html)
+                                # Try JSON-LD, then OpenGraph
+                                meta = extract_article_metadata(html)
+                                image_url = self._process_image_url(meta["image"], url) if meta else None
+                                if not image_url:
+                                    image_url = extract_og_image(html)
                                 if not image_url:
                                     # Fall back to content image
                                     soup = BeautifulSoup(html, 'lxml')
@@ -227,6 +271,12 @@ class ScraperRunner:
                 return 0
                 
             log_info(f"Found {len(sources)} active sources")
+            
+            # Dedup checks for the whole run are answered locally unless possibly a duplicate
+            try:
+                self.db.load_dedup_index()
+            except Exception as e:
+                log_warning(f"Dedup index unavailable, checking each article remotely: {e}")
             total_saved = 0
             successful = 0
             failed = 0
@@ -245,8 +295,7 @@ class ScraperRunner:
                     self.stats['errors'] += 1
 
             # Get pending count safely
-            pending_content = self.db.get_pending_content()
-            pending_count = len(pending_content) if pending_content else 0
+            pending_count = self.db.count("content", status="pending")
 
             # Log final stats
             run_time = time.time() - start_time
@@ -47,55 +47,44 @@ class TelegramReporter:
             # Update metrics for recent posts first
             self.analytics.update_all_recent_posts(hours=48)
             
-            # Get posts from last 24 hours
-            posts_result = self.db.client.table("posts").select("*").gte(
-                "posted_at", yesterday.isoformat()
-            ).execute()
-            
-            posts = posts_result.data if posts_result.data else []
-            
-            # Count by language
-            french_posts = sum(1 for p in posts if p.get('post_language') == 'french')
-            english_posts = sum(1 for p in posts if p.get('post_language') == 'english')
-            
-            # Count by country
+            # Stream posts from last 24 hours, tallying as we go
+            total_posts = 0
+            languages = {}
             countries = {}
-            for p in posts:
+            niches = {}
+            totals = {"reach": 0, "engagements": 0, "reactions": 0, "comments": 0, "shares": 0}
+            for p in self.db.get_posts_since(yesterday.isoformat()):
+                total_posts += 1
+                language = p.get('post_language')
+                languages[language] = languages.get(language, 0) + 1
                 country = p.get('target_country', 'Unknown')
                 countries[country] = countries.get(country, 0) + 1
-            
-            # Count by niche
-            niches = {}
-            for p in posts:
                 niche = p.get('niche', 'Unknown')
                 niches[niche] = niches.get(niche, 0) + 1
+                for key in totals:
+                    totals[key] += p.get(key, 0) or 0
             
-            # Get engagement metrics
-            total_reach = sum(p.get('reach', 0) or 0 for p in posts)
-            total_engagements = sum(p.get('engagements', 0) or 0 for p in posts)
-            total_reactions = sum(p.get('reactions', 0) or 0 for p in posts)
-            total_comments = sum(p.get('comments', 0) or 0 for p in posts)
-            total_shares = sum(p.get('shares', 0) or 0 for p in posts)
+            french_posts = languages.get('french', 0)
+            english_posts = languages.get('english', 0)
             
             # Get pending content count
-            pending_result = self.db.client.table("content").select("id").eq("status", "pending").execute()
-            pending_count = len(pending_result.data) if pending_result.data else 0
+            pending_count = self.db.count("content", status="pending")
             
             # Build report
             report = f"""
 <b>📊 Africa Lens Daily Report</b>
 <b>Date:</b> {today.isoformat()}
 
-<b>📝 Posts Last 24h:</b> {len(posts)}
-• French: {french_posts} ({french_posts*100//max(len(posts),1)}%)
-• English: {english_posts} ({english_posts*100//max(len(posts),1)}%)
+<b>📝 Posts Last 24h:</b> {total_posts}
+• French: {french_posts} ({french_posts*100//max(total_posts,1)}%)
+• English: {english_posts} ({english_posts*100//max(total_posts,1)}%)
 
 <b>📈 Engagement:</b>
-• Reach: {total_reach:,}
-• Engagements: {total_engagements:,}
-• Reactions: {total_reactions:,}
-• Comments: {total_comments:,}
-• Shares: {total_shares:,}
+• Reach: {totals['reach']:,}
+• Engagements: {totals['engagements']:,}
+• Reactions: {totals['reactions']:,}
+• Comments: {totals['comments']:,}
+• Shares: {totals['shares']:,}
 
 <b>🌍 By Country:</b>
 """
@@ -109,7 +98,7 @@ class TelegramReporter:
             report += f"\n<b>📦 Pending Content:</b> {pending_count}"
             
             # Warnings
-            if len(posts) < 20:
+            if total_posts < 20:
                 report += f"\n\n⚠️ Low post count (target: 24/day)"
             
             if pending_count < 30:
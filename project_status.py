@@ -126,11 +126,9 @@ print("\n[4] SCRAPERS")
 print("-" * 40)
 
 scraper_files = {
-    "jeune_afrique.py": "Jeune Afrique (Pan-African French)",
-    "actualite_cd.py": "Actualite.cd (DRC French)",
     "iwacu.py": "IWACU (Burundi French)",
-    "punch.py": "Punch Nigeria (English)",
-    "burkina24.py": "Burkina 24 (French)",
+    "fratmat.py": "Fratmat (Ivory Coast French)",
+    "declarative_scraper.py": "Declarative Scraper (config/scraper_specs.json)",
     "base_scraper.py": "Base Scraper Class",
     "scraper_manager.py": "Scraper Manager",
 }
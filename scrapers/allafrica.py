@@ -4,6 +4,7 @@ import re
 import random
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+import soupsieve
 
 class AllAfricaScraper(BaseScraper):
     def __init__(self, *args, **kwargs):
@@ -53,9 +54,6 @@ class AllAfricaScraper(BaseScraper):
         soup = self.get_soup(html)
         articles = []
         
-        # Try multiple selectors to find article containers
-        article_containers = []
-        
         # Try different container selectors
         container_selectors = [
             'article.story', 
@@ -89,14 +87,19 @@ class AllAfricaScraper(BaseScraper):
             'div.news-list article',
         ]
         
-        # Try each selector until we find some containers
-        for selector in container_selectors:
-            containers = soup.select(selector)
-            if containers:
-                article_containers.extend(containers)
-                if len(article_containers) >= 10:  # Don't need too many containers
-                    article_containers = article_containers[:10]
-                    break
+        # Selectors that matched last run first; full list only when they stop yielding.
+        # In priority order, up to 10 containers (more aren't needed)
+        article_containers = []
+        learned = self.learned_selectors.get("container")
+        if learned:
+            article_containers = self.collect_containers(
+                soup, [sel for sel in learned if sel in container_selectors], limit=10)
+        if not article_containers:
+            article_containers = self.collect_containers(soup, container_selectors, limit=10)
+            learned = [sel for sel in container_selectors
+                       if any(soupsieve.match(sel, c) for c in article_containers)]
+        for selector in learned or []:
+            self.remember_selector("container", selector)
         
         # If still no containers, try to find any article-like elements
         if not article_containers:
@@ -115,10 +118,11 @@ class AllAfricaScraper(BaseScraper):
                 ]
                 
                 # Try each selector until we find a good one
-                for selector in headline_selectors:
+                for selector in self.ordered_selectors("headline", headline_selectors):
                     elem = container.select_one(selector)
                     if elem and self.clean_text(elem.get_text()):
                         headline_elem = elem
+                        self.remember_selector("headline", selector)
                         break
                 
                 if not headline_elem:
@@ -158,11 +162,12 @@ class AllAfricaScraper(BaseScraper):
                 ]
                 
                 # Try each summary selector
-                for selector in summary_selectors:
+                for selector in self.ordered_selectors("summary", summary_selectors):
                     summary_elems = container.select(selector)
                     if summary_elems:
                         summary = ' '.join([self.clean_text(p.get_text()) for p in summary_elems])
                         if len(summary) > 20:  # Only use if we have enough text
+                            self.remember_selector("summary", selector)
                             break
                 
                 # If no summary found, try to get first few paragraphs
@@ -179,26 +184,24 @@ class AllAfricaScraper(BaseScraper):
                     'div.thumbnail img', 'div.media img', 'div.image-container img'
                 ]
                 
-                for selector in img_selectors:
+                for selector in self.ordered_selectors("image", img_selectors):
                     img_elem = container.select_one(selector)
                     if img_elem:
-                        image_url = img_elem.get('data-src') or img_elem.get('src') or img_elem.get('data-lazy-src', '')
+                        image_url = self.resolve_image(img_elem, ('data-src', 'src', 'data-lazy-src'))
                         if image_url:
+                            self.remember_selector("image", selector)
                             # Clean up image URL
                             image_url = image_url.split('?')[0].split('#')[0]
                             image_url = self.make_absolute_url(image_url)
                             break
                 
                 # Add the article to our list (without full text for now)
-                article_data = {
-                    'headline': headline[:200],  # Limit headline length
-                    'url': article_url,
-                    'summary': summary[:500],    # Limit summary length
-                    'image': image_url,
-                    'full_text': None  # We're not fetching full text for now
-                }
-                
-                articles.append(article_data)
+                articles.append(self.make_article(
+                    headline=headline[:200],  # Limit headline length
+                    url=article_url,
+                    summary=summary[:500],    # Limit summary length
+                    image=image_url,
+                ))
                 
                 # Be nice to the server (shorter delay since we're not fetching full content)
                 time.sleep(0.1)
@@ -3,6 +3,7 @@ import requests
 from datetime import datetime
 from scrapers.base_scraper import BaseScraper
 from utils.logger import log_info, log_warning
+from utils.text_classifier import text_classifier
 
 class GNewsAPIScraper(BaseScraper):
     """Scraper for GNews API - African news in French and English"""
@@ -49,38 +50,19 @@ class GNewsAPIScraper(BaseScraper):
                     desc = item.get("description", "")
                     content_text = (title + " " + desc).lower()
                     
-                    country = "Pan-African"
-                    country_code = "Pan"
+                    country, country_code = text_classifier.match_country(content_text) or ("Pan-African", "Pan")
                     
-                    country_keywords = {
-                        "nigeria": ("Nigeria", "NG"),
-                        "kenya": ("Kenya", "KE"),
-                        "senegal": ("Senegal", "SN"),
-                        "mali": ("Mali", "ML"),
-                        "burkina": ("Burkina Faso", "BF"),
-                        "congo": ("DRC", "CD"),
-                        "burundi": ("Burundi", "BI"),
-                        "ghana": ("Ghana", "GH"),
-                        "south africa": ("South Africa", "ZA"),
-                        "morocco": ("Morocco", "MA"),
-                    }
-                    
-                    for keyword, (country_name, code) in country_keywords.items():
-                        if keyword in content_text:
-                            country = country_name
-                            country_code = code
-                            break
-                    
-                    articles.append({
-                        "headline": title,
-                        "summary": desc or "",
-                        "url": article_url,
-                        "image": item.get("image", ""),
-                        "country": country,
-                        "country_code": country_code,
-                        "language": query_params["lang"],
-                        "published_at": item.get("publishedAt", ""),
-                    })
+                    articles.append(self.make_article(
+                        headline=title,
+                        summary=desc or "",
+                        url=article_url,
+                        image=item.get("image", ""),
+                        country=country,
+                        country_code=country_code,
+                        niche=text_classifier.match_niche(content_text),
+                        language=query_params["lang"],
+                        published_at=item.get("publishedAt", ""),
+                    ))
                     
                     if len(articles) >= 15:
                         break
@@ -136,16 +118,16 @@ class YouTubeAPIScraper(BaseScraper):
                     
                     snippet = item.get("snippet", {})
                     
-                    articles.append({
-                        "headline": snippet.get("title", ""),
-                        "summary": snippet.get("description", "")[:500],
-                        "url": f"https://www.youtube.com/watch?v={video_id}",
-                        "image": snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
-                        "country": "Pan-African",
-                        "country_code": "Pan",
-                        "language": lang,
-                        "published_at": snippet.get("publishedAt", ""),
-                    })
+                    articles.append(self.make_article(
+                        headline=snippet.get("title", ""),
+                        summary=snippet.get("description", "")[:500],
+                        url=f"https://www.youtube.com/watch?v={video_id}",
+                        image=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
+                        country="Pan-African",
+                        country_code="Pan",
+                        language=lang,
+                        published_at=snippet.get("publishedAt", ""),
+                    ))
                     
                     if len(articles) >= 10:
                         break
@@ -205,33 +187,19 @@ class NewsAPIScraper(BaseScraper):
                     
                     content_text = (title + " " + (item.get("description") or "")).lower()
                     
-                    country = "Pan-African"
-                    country_code = "Pan"
-                    
-                    country_keywords = {
-                        "nigeria": ("Nigeria", "NG"),
-                        "kenya": ("Kenya", "KE"),
-                        "ghana": ("Ghana", "GH"),
-                        "south africa": ("South Africa", "ZA"),
-                        "egypt": ("Egypt", "EG"),
-                    }
-                    
-                    for keyword, (country_name, code) in country_keywords.items():
-                        if keyword in content_text:
-                            country = country_name
-                            country_code = code
-                            break
+                    country, country_code = text_classifier.match_country(content_text) or ("Pan-African", "Pan")
                     
-                    articles.append({
-                        "headline": title,
-                        "summary": item.get("description", "") or "",
-                        "url": article_url,
-                        "image": item.get("urlToImage", ""),
-                        "country": country,
-                        "country_code": country_code,
-                        "language": lang,
-                        "published_at": item.get("publishedAt", ""),
-                    })
+                    articles.append(self.make_article(
+                        headline=title,
+                        summary=item.get("description", "") or "",
+                        url=article_url,
+                        image=item.get("urlToImage", ""),
+                        country=country,
+                        country_code=country_code,
+                        niche=text_classifier.match_niche(content_text),
+                        language=lang,
+                        published_at=item.get("publishedAt", ""),
+                    ))
                     
                     if len(articles) >= 15:
                         break
@@ -270,15 +238,15 @@ class GoogleTrendsScraper(BaseScraper):
                     trending = pytrends.trending_searches(pn=geo)
                     
                     for idx, topic in enumerate(trending[0].tolist()[:3]):
-                        articles.append({
-                            "headline": f"Trending: {topic}",
-                            "summary": f"Currently trending in {country_name}",
-                            "url": f"https://trends.google.com/trends/explore?geo={code}&q={topic}",
-                            "image": "",
-                            "country": country_name,
-                            "country_code": code,
-                            "language": "english",
-                        })
+                        articles.append(self.make_article(
+                            headline=f"Trending: {topic}",
+                            summary=f"Currently trending in {country_name}",
+                            url=f"https://trends.google.com/trends/explore?geo={code}&q={topic}",
+                            image="",
+                            country=country_name,
+                            country_code=code,
+                            language="english",
+                        ))
                 except Exception:
                     continue
             
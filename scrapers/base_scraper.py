@@ -1,9 +1,70 @@
 from abc import ABC, abstractmethod
 from bs4 import BeautifulSoup
-from utils.http_helper import fetch_page, extract_og_image
+from lxml import etree
+from config.settings import IMAGE_WIDTH
+from utils.http_helper import fetch_page
 from utils.database import Database
 from utils.logger import log_info, log_error, log_scrape, log_warning
 from utils.image_finder import get_stock_image
+from utils.structured_data import extract_news_articles, extract_article_metadata
+from utils.article import Article
+from scrapers.lxml_backend import LxmlNode, parse_html
+from scrapers.body_extractor import extract_body
+
+# A listing container is only worth parsing if a link or heading in it reads like a headline
+CONTAINER_CONTENT = "a[href], h1, h2, h3, h4"
+MIN_HEADLINE_CHARS = 20
+
+def parse_srcset(srcset, base_width=None):
+    """
+    Parse a srcset attribute into (url, width) pairs. Density descriptors
+    (2x) are converted using the img's width attribute when known.
+    Follows the HTML grammar: a URL runs to the next whitespace, so commas
+    inside it (CDN transforms like w_400,h_300) are kept.
+    """
+    candidates = []
+    text = srcset or ""
+    pos = 0
+    while pos < len(text):
+        while pos < len(text) and (text[pos].isspace() or text[pos] == ","):
+            pos += 1
+        start = pos
+        while pos < len(text) and not text[pos].isspace():
+            pos += 1
+        url = text[start:pos]
+        descriptors = []
+        if url.endswith(","):
+            # A comma straight after the URL ends the candidate
+            url = url.rstrip(",")
+        else:
+            end = text.find(",", pos)
+            end = len(text) if end == -1 else end
+            descriptors = text[pos:end].split()
+            pos = end + 1
+        if not url or url.startswith("data:"):
+            continue
+        width = None
+        if descriptors:
+            descriptor = descriptors[0].lower()
+            try:
+                if descriptor.endswith("w"):
+                    width = int(descriptor[:-1])
+                elif descriptor.endswith("x") and base_width:
+                    width = int(float(descriptor[:-1]) * base_width)
+            except ValueError:
+                pass
+        candidates.append((url, width))
+    return candidates
+
+
+def pick_rendition(candidates, min_width=IMAGE_WIDTH):
+    """Smallest rendition at least min_width wide, else the largest available"""
+    sized = [(width, url) for url, width in candidates if width]
+    if not sized:
+        return candidates[0][0] if candidates else ""
+    large_enough = [c for c in sized if c[0] >= min_width]
+    return min(large_enough)[1] if large_enough else max(sized)[1]
+
 
 class GenericScraper(ABC):
     """A generic scraper that can be used as a fallback for any source"""
@@ -15,6 +76,9 @@ class GenericScraper(ABC):
         self.country_code = country_code
         self.language = language
         self.niche = niche
+        self.learned_selectors = {}
+        self._selector_hits = {}
+        self._forgotten = set()
     
     def parse_articles(self, html):
         """
@@ -48,6 +112,42 @@ class GenericScraper(ABC):
             
         return articles or []
 
+    def ordered_selectors(self, key, selectors):
+        """Selectors that worked for this source last time first, then the rest"""
+        learned = [sel for sel in self.learned_selectors.get(key, []) if sel in selectors]
+        if not learned:
+            return selectors
+        return learned + [sel for sel in selectors if sel not in learned]
+
+    def remember_selector(self, key, selector):
+        """Record that a selector produced a result during this run"""
+        hits = self._selector_hits.setdefault(key, {})
+        hits[selector] = hits.get(selector, 0) + 1
+
+    def forget_selectors(self, key):
+        """Drop what was learned for key unless a selector for it works later this run"""
+        self._forgotten.add(key)
+
+    def learned_selector_update(self):
+        """
+        Selectors that yielded results this run, most productive first.
+        Returns None unless the winning selector for some key changed (or a
+        forgotten key was dropped), so callers only persist when the next run
+        would try something else first.
+        """
+        learned = dict(self.learned_selectors)
+        changed = False
+        for key in self._forgotten:
+            if key in learned and key not in self._selector_hits:
+                del learned[key]
+                changed = True
+        for key, hits in self._selector_hits.items():
+            ranked = sorted(hits, key=lambda sel: -hits[sel])
+            if (learned.get(key) or [None])[0] != ranked[0]:
+                learned[key] = ranked
+                changed = True
+        return learned if changed else None
+
     def scrape(self):
         """Default implementation of the scrape method"""
         log_info(f"Scraping {self.name} (using generic scraper)...")
@@ -60,6 +160,13 @@ class GenericScraper(ABC):
         return articles
 
 class BaseScraper(GenericScraper):
+    # "bs4" (BeautifulSoup) or "lxml" (native lxml tree, precompiled selectors)
+    parser_backend = "bs4"
+    # Listing pages read per run; page N+1 is only fetched when page N was all new
+    max_pages = 1
+    # e.g. "{url}/page/{page}/"; without one the page's rel="next" link is followed
+    page_url_template = None
+
     def __init__(self, source_id, name, url, country, country_code, language, niche):
         self.source_id = source_id
         self.name = name
@@ -68,6 +175,9 @@ class BaseScraper(GenericScraper):
         self.country_code = country_code
         self.language = language
         self.niche = niche
+        self.learned_selectors = {}
+        self._selector_hits = {}
+        self._forgotten = set()
     
     @abstractmethod
     def parse_articles(self, html):
@@ -84,21 +194,21 @@ class BaseScraper(GenericScraper):
         saved_count = 0
         
         for article in articles:
-            if not article.get("headline"):
+            if not article.headline:
                 continue
             
             # Check if exists before fetching body to save requests
-            if db.content_exists(article.get("headline", "")):
+            if db.content_exists(article.headline):
                 continue
 
             # Store the initial image URL before any processing
-            initial_image = article.get("image", "")
+            initial_image = article.image
             
             # Fetch full article details (text + high-res image)
-            full_text, og_image = self.fetch_full_details(article.get("url", ""))
+            full_text, og_image = self.fetch_full_details(article.url)
             
             # Use full text if found, otherwise fall back to excerpt
-            final_summary = full_text if full_text and len(full_text) > 200 else article.get("summary", "")
+            final_summary = full_text if full_text and len(full_text) > 200 else article.summary
             
             # Use OG image if list-page image is missing/broken
             final_image = initial_image  # Start with the initial image
@@ -108,21 +218,21 @@ class BaseScraper(GenericScraper):
             # LAST RESORT: Stock Image Fallback - Use article-specific stock image
             if not final_image or "base64" in final_image or any(domain in str(final_image).lower() for domain in ["cdn.tuko.co.ke", "placeholder", "default", "logo", "icon"]):
                 # Create a unique query using headline and URL to ensure different images
-                unique_query = f"{article.get('headline', '')} {article.get('url', '')}"
+                unique_query = f"{article.headline} {article.url}"
                 stock_img = get_stock_image(unique_query)
                 if stock_img:
                     final_image = stock_img
-                    log_info(f"Using unique stock image for: {article.get('headline')[:20]}...")
+                    log_info(f"Using unique stock image for: {article.headline[:20]}...")
                 else:
-                    log_warning(f"No suitable image found for: {article.get('headline')[:20]}...")
-                    self.mark_article_skipped(article.get("url"), "no_suitable_image")
+                    log_warning(f"No suitable image found for: {article.headline[:20]}...")
+                    self.mark_article_skipped(article.url, "no_suitable_image")
                     continue  # Skip this article if no image is found
 
             result = db.add_content(
                 source_id=self.source_id,
-                headline=article.get("headline", ""),
+                headline=article.headline,
                 summary=final_summary, 
-                original_url=article.get("url", ""),
+                original_url=article.url,
                 image_url=final_image,
                 initial_image_url=initial_image,  # Pass the initial image URL
                 source_language=self.language,
@@ -144,6 +254,65 @@ class BaseScraper(GenericScraper):
         """Mark an article as skipped with a reason"""
         log_warning(f"Article skipped - {reason}: {url}")
 
+    def make_article(self, **fields):
+        """Build an Article, defaulting source metadata to this scraper's source"""
+        fields.setdefault("source_id", self.source_id)
+        for key in ("country", "country_code", "language", "niche"):
+            if not fields.get(key):
+                fields[key] = getattr(self, key)
+        return Article(**fields)
+
+    def parse_structured_articles(self, html, min_articles=3):
+        """
+        Articles from the page's JSON-LD NewsArticle blocks. Returns [] unless
+        the page lists enough of them to stand in for DOM parsing.
+        """
+        articles = []
+        for item in extract_news_articles(html):
+            url = self.make_absolute_url(item["url"])
+            if not url or url.rstrip("/") == self.url.rstrip("/"):
+                continue
+            articles.append(self.make_article(
+                headline=item["headline"],
+                summary=item["summary"][:500],
+                url=url,
+                image=self.make_absolute_url(item["image"]),
+                published_at=item["published_at"],
+            ))
+        return articles[:15] if len(articles) >= min_articles else []
+
+    def next_page_url(self, html, page):
+        """URL of listing page number `page`, or None when it can't be found"""
+        if self.page_url_template:
+            return self.page_url_template.format(url=self.url.rstrip("/"), page=page)
+        link = parse_html(html).select_one('link[rel="next"], a[rel="next"]')
+        href = link.get("href") if link is not None else None
+        return self.make_absolute_url(href) if href else None
+
+    def paginate(self, articles, html, parse, existing_urls):
+        """
+        Follow listing pages while every article on the current page is new.
+        `parse` turns a page's HTML into articles and `existing_urls` returns
+        the subset of URLs already stored. Stops at max_pages, at the first
+        page holding a known story, or when no next page can be found.
+        """
+        page_articles = articles
+        seen = {article.url for article in articles}
+        page = 1
+        while page_articles and page < self.max_pages:
+            if existing_urls([article.url for article in page_articles]):
+                break
+            page += 1
+            url = self.next_page_url(html, page)
+            html = fetch_page(url) if url else None
+            if not html:
+                break
+            page_articles = [a for a in parse(html) if a.url not in seen]
+            seen.update(article.url for article in page_articles)
+            articles = articles + page_articles
+            log_info(f"{self.name}: page {page} added {len(page_articles)} articles")
+        return articles
+
     def fetch_full_details(self, url):
         """Fetches full text and og:image from the article URL."""
         if not url:
@@ -152,32 +321,135 @@ class BaseScraper(GenericScraper):
             html = fetch_page(url)
             if not html:
                 return "", ""
-            soup = self.get_soup(html)
-            
-            # 1. Extract Body Text
-            body_container = soup.select_one("article, div.article-body, div.post-content, div.entry-content, div#content, div.content")
-            if body_container:
-                paragraphs = body_container.find_all("p")
-            else:
-                paragraphs = soup.find_all("p")
-            
-            text_blocks = [p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 40]
-            body_text = "\n\n".join(text_blocks)
-            
-            # 2. Extract OpenGraph Image (High Quality)
-            og_image = extract_og_image(soup)
-            if og_image:
-                og_image = self.make_absolute_url(og_image)
-            
-            return body_text, og_image
+            return self.extract_full_details(html)
             
         except Exception as e:
             log_warning(f"Could not fetch details for {url}: {e}")
             return "", ""
     
+    def extract_full_details(self, html):
+        """Extract body text and og:image from an article page's HTML."""
+        # 0. Structured data fast path: no DOM parse when JSON-LD has it all
+        meta = extract_article_metadata(html)
+        if meta and len(meta["body"]) > 200 and meta["image"]:
+            return meta["body"], self.make_absolute_url(meta["image"])
+        
+        # 1. Body text and meta images from one bounded traversal
+        body_text, page_meta = extract_body(html)
+        
+        # 2. Extract OpenGraph Image (High Quality)
+        og_image = page_meta.get("og:image") or page_meta.get("twitter:image") or (meta["image"] if meta else "")
+        if og_image:
+            og_image = self.make_absolute_url(og_image)
+        
+        return body_text, og_image
+    
     def get_soup(self, html):
+        if self.parser_backend == "lxml":
+            return parse_html(html)
         return BeautifulSoup(html, "lxml")
     
+    def resolve_image(self, img, attrs=("data-lazy-src", "data-src", "src"), min_width=IMAGE_WIDTH):
+        """
+        Pick the best image URL for an <img>: srcset/data-srcset and sibling
+        <picture><source> renditions first (smallest at or above min_width),
+        then the plain attributes in order. Works on bs4 tags, LxmlNode
+        wrappers and raw lxml elements. Returns a relative or absolute URL.
+        """
+        el = img.el if isinstance(img, LxmlNode) else img
+        try:
+            base_width = int(el.get("width") or 0) or None
+        except ValueError:
+            base_width = None
+
+        candidates = []
+        for source in self._picture_sources(el) + [el]:
+            for attr in ("data-srcset", "srcset"):
+                candidates += parse_srcset(source.get(attr), base_width)
+        if candidates:
+            best = pick_rendition(candidates, min_width)
+            if best:
+                return best
+
+        for attr in attrs:
+            src = el.get(attr) or ""
+            if src and not src.startswith("data:"):
+                return src
+        return ""
+
+    def _picture_sources(self, el):
+        """<source> elements of the <picture> wrapping an img, if any"""
+        if isinstance(el, etree._Element):
+            parent = el.getparent()
+            if parent is None or parent.tag != "picture":
+                return []
+            return [child for child in parent if child.tag == "source"]
+        parent = el.parent
+        if parent is None or parent.name != "picture":
+            return []
+        return parent.find_all("source", recursive=False)
+
+    def collect_containers(self, soup, selectors, limit=None):
+        """
+        Containers for a list of selectors tried in priority order, like a
+        per-selector loop: lower-priority selectors are only consulted until
+        `limit` containers are collected. Matches without a headline-like link
+        or heading are ignored, and nested matches collapse to the outermost
+        one that wraps a single story, so a card and its inner wrapper are
+        parsed once (as the card) while a wrapper around several cards gives
+        way to them.
+        """
+        candidates = {}
+        order = []
+        for selector in selectors:
+            for match in soup.select(selector):
+                node = self._node_id(match)
+                if node in candidates or not self._has_headline(match):
+                    continue
+                # Ancestor elements are kept alive so their ids stay unique
+                ancestors = self._ancestors(match)
+                candidates[node] = (match, ancestors, {id(el) for el in ancestors})
+                order.append(node)
+            if limit:
+                collected = self._outermost_cards(candidates, order)
+                if len(collected) >= limit:
+                    return collected[:limit]
+        return self._outermost_cards(candidates, order)
+
+    def _has_headline(self, node):
+        return any(len(el.get_text(strip=True)) >= MIN_HEADLINE_CHARS for el in node.select(CONTAINER_CONTENT))
+
+    def _outermost_cards(self, candidates, order):
+        enclosing = {node: ids & candidates.keys() for node, (_, _, ids) in candidates.items()}
+        inner = {node: [] for node in order}
+        for node in order:
+            for outer in enclosing[node]:
+                inner[outer].append(node)
+
+        def is_card(node):
+            # Candidates inside a card are nested in one another, never side by side
+            if not inner[node]:
+                return True
+            deepest = max(inner[node], key=lambda other: len(enclosing[other]))
+            return all(other == deepest or other in enclosing[deepest] for other in inner[node])
+
+        cards = {node for node in order if is_card(node)}
+        kept = [node for node in order if node in cards and not enclosing[node] & cards]
+        # A card takes the priority of the best-ranked match it absorbed
+        rank = {node: i for i, node in enumerate(order)}
+        for node in order:
+            for outer in enclosing[node] & set(kept):
+                rank[outer] = min(rank[outer], rank[node])
+        return [candidates[node][0] for node in sorted(kept, key=rank.get)]
+
+    def _node_id(self, node):
+        return id(node.el) if isinstance(node, LxmlNode) else id(node)
+
+    def _ancestors(self, node):
+        if isinstance(node, LxmlNode):
+            return list(node.el.iterancestors())
+        return list(node.parents)
+
     def clean_text(self, text):
         if not text:
             return ""
@@ -0,0 +1,96 @@
+from scrapers.lxml_backend import parse_html
+from utils.text_classifier import text_classifier
+
+# Subtrees that never hold article text
+SKIP_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form",
+             "iframe", "svg", "button", "select", "figure"}
+SKIP_CLASSES = {"ads", "advertisement", "social-share", "comments", "related", "share",
+                "newsletter", "cookie", "sidebar", "menu"}
+META_KEYS = {"og:image", "twitter:image", "og:description", "description"}
+
+
+def _skip(el):
+    if el.tag in SKIP_TAGS:
+        return True
+    classes = el.get("class")
+    return bool(classes) and not SKIP_CLASSES.isdisjoint(classes.split())
+
+
+def extract_body(html, max_chars=3000, min_paragraph=40):
+    """
+    Text-density body extraction in a single bounded traversal.
+
+    Paragraphs are credited to their parent (full length) and grandparent
+    (half), skipping link-heavy and boilerplate blocks. The walk stops as
+    soon as one container holds max_chars of text, and the tree is cleared
+    afterwards to release memory.
+
+    Returns (body_text, meta) where meta holds og:image, twitter:image,
+    og:description and description found on the way.
+    """
+    root = parse_html(html).el
+    meta = {}
+    scores = {}
+    chars = {}
+    blocks = {}
+    best = None
+
+    try:
+        stack = [root]
+        while stack:
+            el = stack.pop()
+            if not isinstance(el.tag, str) or _skip(el):
+                continue
+
+            if el.tag == "meta":
+                key = el.get("property") or el.get("name")
+                if key in META_KEYS and key not in meta and el.get("content"):
+                    meta[key] = el.get("content").strip()
+                continue
+
+            if el.tag != "p":
+                # Children in reverse so they pop in document order
+                stack.extend(reversed(el))
+                continue
+
+            text = el.text_content().strip()
+            if len(text) <= min_paragraph:
+                continue
+            link_chars = sum(len(a.text_content()) for a in el.iter("a"))
+            if link_chars * 2 > len(text):
+                continue
+            if text_classifier.has(text, "body_boilerplate"):
+                continue
+
+            parent = el.getparent()
+            for container, weight in ((parent, 1.0), (parent.getparent() if parent is not None else None, 0.5)):
+                if container is None:
+                    continue
+                scores[container] = scores.get(container, 0) + len(text) * weight
+                chars[container] = chars.get(container, 0) + len(text)
+                blocks.setdefault(container, []).append(text)
+                if best is None or scores[container] > scores[best]:
+                    best = container
+
+            if best is not None and chars[best] >= max_chars:
+                break
+
+        body = "\n\n".join(blocks[best]) if best is not None else ""
+    finally:
+        # Drop references into the tree before freeing it
+        scores.clear()
+        chars.clear()
+        blocks.clear()
+        best = None
+        root.clear()
+
+    return body, meta
+
+
+def body_quality(body, reference):
+    """Share of the reference text's words found in the extracted body (0..1)"""
+    ref_words = set(reference.lower().split())
+    if not ref_words:
+        return None
+    body_words = set(body.lower().split())
+    return round(len(ref_words & body_words) / len(ref_words), 3)
@@ -0,0 +1,146 @@
+import os
+import json
+from scrapers.base_scraper import BaseScraper
+from scrapers.lxml_backend import compile_selector
+from utils.logger import log_warning
+
+SPECS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "scraper_specs.json")
+
+SPEC_DEFAULTS = {
+    "container": None,          # CSS selector, or list of selectors concatenated in order
+    "container_limit": 15,      # Containers inspected per page (null = scan until max_articles)
+    "headline": "a",
+    "min_headline_length": 16,
+    "summary": None,
+    "image": "img",
+    "image_attrs": ["data-src", "src"],
+    "image_reject": [],
+    "max_articles": 15,
+    "max_pages": 1,             # Listing pages followed while every item is new
+    "page_url": None,           # e.g. "{url}/page/{page}/"; null follows rel="next"
+}
+
+_specs = None
+_compiled = {}
+
+
+def load_specs(path=SPECS_PATH):
+    """Load site specs from config/scraper_specs.json (once per process)"""
+    global _specs
+    if _specs is None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                _specs = json.load(f)
+        except Exception as e:
+            log_warning(f"Could not load scraper specs from {path}: {e}")
+            _specs = {}
+    return _specs
+
+
+def get_spec(source):
+    """Spec for a source: the sources.scraper_spec column wins over the config file"""
+    spec = source.get("scraper_spec")
+    if isinstance(spec, str):
+        try:
+            spec = json.loads(spec)
+        except ValueError:
+            log_warning(f"Invalid scraper_spec for {source.get('name')}, ignoring")
+            spec = None
+    return spec or load_specs().get(source.get("name"))
+
+
+class CompiledSpec:
+    """A scraper spec with every selector compiled to XPath"""
+    __slots__ = ("containers", "container_limit", "headline", "min_headline_length",
+                 "summary", "image", "image_attrs", "image_reject", "max_articles", "max_pages", "page_url")
+
+    def __init__(self, spec):
+        spec = {**SPEC_DEFAULTS, **spec}
+        if not spec["container"]:
+            raise ValueError("scraper spec needs a 'container' selector")
+        containers = spec["container"]
+        if isinstance(containers, str):
+            containers = [containers]
+        self.containers = [compile_selector(css) for css in containers]
+        self.container_limit = spec["container_limit"]
+        self.headline = compile_selector(spec["headline"])
+        self.min_headline_length = spec["min_headline_length"]
+        self.summary = compile_selector(spec["summary"]) if spec["summary"] else None
+        self.image = compile_selector(spec["image"]) if spec["image"] else None
+        self.image_attrs = tuple(spec["image_attrs"])
+        self.image_reject = tuple(spec["image_reject"])
+        self.max_articles = spec["max_articles"]
+        self.max_pages = spec["max_pages"]
+        self.page_url = spec["page_url"]
+
+
+def compile_spec(spec):
+    """Compile a spec once per process, keyed by its canonical JSON form"""
+    key = json.dumps(spec, sort_keys=True)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compiled[key] = CompiledSpec(spec)
+    return compiled
+
+
+class DeclarativeScraper(BaseScraper):
+    """Site scraper driven entirely by a declarative selector spec"""
+    parser_backend = "lxml"
+
+    def __init__(self, source_id, name, url, country, country_code, language, niche, spec=None):
+        super().__init__(source_id, name, url, country, country_code, language, niche)
+        self.spec = compile_spec(spec if spec is not None else load_specs().get(name, {}))
+        self.max_pages = self.spec.max_pages
+        self.page_url_template = self.spec.page_url
+
+    def parse_articles(self, html):
+        spec = self.spec
+        root = self.get_soup(html).el
+        articles = []
+
+        containers = []
+        for query in spec.containers:
+            containers.extend(query(root))
+        if spec.container_limit is not None:
+            containers = containers[:spec.container_limit]
+
+        for item in containers:
+            if len(articles) >= spec.max_articles:
+                break
+
+            links = spec.headline(item)
+            if not links:
+                continue
+            link = links[0]
+
+            headline = self.clean_text(link.text_content())
+            if len(headline) < spec.min_headline_length:
+                continue
+            url = self.make_absolute_url(link.get("href", ""))
+
+            summary = ""
+            if spec.summary is not None:
+                nodes = spec.summary(item)
+                if nodes:
+                    summary = self.clean_text(nodes[0].text_content())
+
+            image = ""
+            if spec.image is not None:
+                imgs = spec.image(item)
+                if imgs:
+                    image = self._image_from(imgs[0])
+
+            articles.append(self.make_article(
+                headline=headline,
+                summary=summary[:500],
+                url=url,
+                image=image
+            ))
+
+        return articles
+
+    def _image_from(self, img):
+        image = self.resolve_image(img, self.spec.image_attrs)
+        if any(x in image for x in self.spec.image_reject):
+            return ""
+        return self.make_absolute_url(image)
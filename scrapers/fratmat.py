@@ -1,6 +1,8 @@
 from scrapers.base_scraper import BaseScraper
 
 class FratmatScraper(BaseScraper):
+    parser_backend = "lxml"
+
     def parse_articles(self, html):
         soup = self.get_soup(html)
         articles = []
@@ -22,9 +24,7 @@ class FratmatScraper(BaseScraper):
             "div.col-12"
         ]
         
-        containers = []
-        for selector in selectors:
-            containers.extend(soup.select(selector))
+        containers = self.collect_containers(soup, selectors)
 
         for item in containers:
             if len(articles) >= 15:
@@ -62,19 +62,19 @@ class FratmatScraper(BaseScraper):
                 image = ""
                 img_tag = item.select_one("img.lazy, img")
                 if img_tag:
-                    image = img_tag.get("data-src") or img_tag.get("src") or ""
-                    if image.startswith("data:") or "no-image" in image:
+                    image = self.resolve_image(img_tag, ("data-src", "src"))
+                    if "no-image" in image:
                         image = ""
                     elif image:
                         image = self.make_absolute_url(image)
 
                 if headline and len(headline) > 15:
-                    articles.append({
-                        "headline": headline,
-                        "summary": summary[:500],
-                        "url": url,
-                        "image": image
-                    })
+                    articles.append(self.make_article(
+                        headline=headline,
+                        summary=summary[:500],
+                        url=url,
+                        image=image
+                    ))
             except Exception:
                 continue
 
@@ -1,75 +1,149 @@
 from scrapers.base_scraper import BaseScraper
+from scrapers.lxml_backend import compile_selector
 from utils.http_helper import fetch_page
 from utils.logger import log_info, log_warning
+from utils.structured_data import extract_article_metadata
+from scrapers.body_extractor import extract_body
+from utils.text_classifier import text_classifier
+
+SUMMARY_CLASSES = {"excerpt", "summary", "description", "desc", "chapo"}
+# Story containers a source's headlines may sit in; the one that held them is learned
+ARTICLE_SELECTORS = ["article", ".article", ".post", ".entry", ".news-item"]
+# A learned container selector is only trusted while it yields this many articles
+MIN_CONTAINER_ARTICLES = 5
 
 class GenericScraper(BaseScraper):
+    parser_backend = "lxml"
+
+    def _usable_image(self, el):
+        """Return the image src of an <img> element if it is worth keeping"""
+        if el.tag != "img":
+            return None
+        src = self.resolve_image(el)
+        if src and "logo" not in src.lower() and "icon" not in src.lower():
+            return src
+        return None
+
+    def _summary_text(self, el):
+        """Return the cleaned text of a summary-like element, or None"""
+        if el.tag != "p" and not SUMMARY_CLASSES.intersection((el.get("class") or "").split()):
+            return None
+        text = el.text_content().strip()
+        return text if len(text) > 30 else None
+
+    def index_containers(self, root):
+        """
+        Single bottom-up pass over the tree recording, for every element,
+        its first usable image src and first summary text (document order).
+        Anchor lookups against any ancestor are then O(1).
+        """
+        images = {}
+        summaries = {}
+        elements = [el for el in root.iter() if isinstance(el.tag, str)]
+        for el in reversed(elements):
+            image = None
+            summary = None
+            for child in el:
+                if not isinstance(child.tag, str):
+                    continue
+                if image is None:
+                    image = self._usable_image(child) or images.get(child)
+                if summary is None and child.tag != "a":
+                    summary = self._summary_text(child) or summaries.get(child)
+                if image is not None and summary is not None:
+                    break
+            if image is not None:
+                images[el] = image
+            if summary is not None:
+                summaries[el] = summary
+        return elements, images, summaries
+
     def parse_articles(self, html):
-        soup = self.get_soup(html)
+        root = self.get_soup(html).el
+
+        # Keep `elements` alive so lxml element proxies (dict keys) stay stable
+        elements, images, summaries = self.index_containers(root)
+
+        # Links inside the story containers that held this source's headlines last time
+        learned = [sel for sel in self.learned_selectors.get("article", []) if sel in ARTICLE_SELECTORS]
+        if learned:
+            anchors = [a for container in compile_selector(learned[0])(root) for a in container.iter("a")]
+            articles, _ = self.articles_from_links(anchors, images, summaries)
+            if len(articles) >= MIN_CONTAINER_ARTICLES:
+                self.remember_selector("article", learned[0])
+                return articles
+            # Stale: unless learn_container finds another, stop trying it
+            self.forget_selectors("article")
+
+        articles, used = self.articles_from_links([el for el in elements if el.tag == "a"], images, summaries)
+        self.learn_container(root, used)
+        return articles
+
+    def learn_container(self, root, anchors):
+        """
+        Remember the first story-container selector holding at least 80% of
+        this run's headline links, so the next run can skip the rest of the page
+        without losing stories.
+        """
+        for selector in ARTICLE_SELECTORS:
+            inside = {a for container in compile_selector(selector)(root) for a in container.iter("a")}
+            covered = sum(1 for a in anchors if a in inside)
+            if covered >= MIN_CONTAINER_ARTICLES and covered * 5 >= len(anchors) * 4:
+                self.remember_selector("article", selector)
+                return
+
+    def articles_from_links(self, anchors, images, summaries):
+        """Articles for headline-like links, plus the <a> elements they came from"""
         articles = []
+        used = []
         seen_urls = set()
 
-        for a in soup.select("a[href]"):
-            text = a.get_text().strip()
-            href = a.get("href", "")
+        for a in anchors:
+            href = a.get("href")
+            if href is None:
+                continue
+            text = a.text_content().strip()
             
             if len(text) < 25 or len(text) > 200:
                 continue
             if href in seen_urls:
                 continue
-            if any(x in text.lower() for x in [
-                "cookie", "privacy", "subscribe", "contact", "menu", 
-                "lire la suite", "read more", "en savoir plus", "aller au contenu",
-                "newsletter", "login", "sign in", "recherche", "abonnez",
-                "recevez", "suivez", "partager"
-            ]):
+            if text_classifier.has(text, "link_boilerplate"):
                 continue
             
             seen_urls.add(href)
             url = self.make_absolute_url(href)
             
-            # Look for image in parent containers
+            # Look for image and summary in parent containers
             image = ""
-            el = a
-            for _ in range(5):
-                el = el.find_parent()
-                if not el:
-                    break
-                img = el.select_one("img")
-                if img:
-                    src = img.get("data-lazy-src") or img.get("data-src") or img.get("src") or ""
-                    if src and not src.startswith("data:") and "logo" not in src.lower() and "icon" not in src.lower():
-                        image = self.make_absolute_url(src)
-                        break
-            
-            # Look for summary in same parent container
             summary = ""
             el = a
-            for _ in range(3):
-                el = el.find_parent()
-                if not el:
+            for depth in range(5):
+                el = el.getparent()
+                if el is None:
                     break
-                for selector in ["p", ".excerpt", ".summary", ".description", ".desc", ".chapo"]:
-                    p = el.select_one(selector)
-                    if p and p != a and len(p.get_text().strip()) > 30:
-                        summary = self.clean_text(p.get_text())[:500]
-                        break
-                if summary:
+                if not image and el in images:
+                    image = self.make_absolute_url(images[el])
+                if not summary and depth < 3 and el in summaries:
+                    summary = self.clean_text(summaries[el])[:500]
+                if image and (summary or depth >= 2):
                     break
             
             headline = self.clean_text(text)
             
             if headline and len(headline) > 15:
-                articles.append({
-                    "headline": headline,
-                    "summary": summary,
-                    "url": url,
-                    "image": image
-                })
+                articles.append(self.make_article(
+                    headline=headline,
+                    summary=summary,
+                    url=url,
+                    image=image
+                ))
+                used.append(a)
             
             if len(articles) >= 15:
                 break
 
-        return articles
+        return articles, used
     
     def fetch_article_content(self, url):
         """Fetch full article content for AI generation"""
@@ -77,75 +151,41 @@ class GenericScraper(BaseScraper):
             html = fetch_page(url)
             if not html:
                 return ""
-            
-            soup = self.get_soup(html)
-            
-            # 1. Try meta description first (most reliable)
-            for meta_sel in ['meta[property="og:description"]', 'meta[name="description"]']:
-                meta = soup.select_one(meta_sel)
-                if meta:
-                    desc = meta.get("content", "").strip()
-                    if len(desc) > 50:
-                        return desc[:1000]
-            
-            # Remove unwanted elements
-            for tag in soup.select("script, style, nav, header, footer, aside, .ads, .advertisement, .social-share, .comments, .related"):
-                tag.decompose()
-            
-            # 2. Try common article content selectors
-            content_selectors = [
-                ".field-name-body p",
-                ".field--name-body p",
-                ".article-content p",
-                "article .content p", 
-                ".post-content p", 
-                ".entry-content p",
-                ".story-body p",
-                ".article-body p",
-                "article p",
-                "main p"
-            ]
-            
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    paragraphs = []
-                    for el in elements[:5]:
-                        text = el.get_text().strip()
-                        # Skip short or boilerplate paragraphs
-                        if len(text) > 40 and not any(x in text.lower() for x in ["cookie", "subscribe", "copyright", "fm:", "publi"]):
-                            paragraphs.append(text)
-                    if paragraphs:
-                        content = " ".join(paragraphs)
-                        if len(content) > 100:
-                            return content[:1500]
-            
-            # 3. Fallback: get first substantial paragraphs
-            paragraphs = soup.select("p")
-            good_paragraphs = []
-            for p in paragraphs:
-                text = p.get_text().strip()
-                if 50 < len(text) < 1000:
-                    if not any(x in text.lower() for x in ["cookie", "subscribe", "copyright", "fm:", "publi"]):
-                        good_paragraphs.append(text)
-                if len(good_paragraphs) >= 3:
-                    break
-            
-            if good_paragraphs:
-                return " ".join(good_paragraphs)[:1500]
-            
-            return ""
+            return self.extract_article_content(html)
             
         except Exception as e:
             return ""
     
+    def extract_article_content(self, html):
+        """Extract article content from an article page's HTML"""
+        # 0. JSON-LD articleBody/description, without parsing the DOM
+        meta = extract_article_metadata(html)
+        if meta:
+            for text in (meta["body"], meta["summary"]):
+                if len(text) > 100:
+                    return " ".join(text.split())[:1500]
+        
+        body, page_meta = extract_body(html, max_chars=1500)
+        
+        # 1. Meta description first (most reliable)
+        for key in ("og:description", "description"):
+            desc = page_meta.get(key, "")
+            if len(desc) > 50:
+                return desc[:1000]
+        
+        # 2. Densest block of article paragraphs
+        if len(body) > 100:
+            return " ".join(body.split("\n\n"))[:1500]
+        
+        return ""
+    
     def enrich_article(self, article):
         """Fetch article page to get summary if missing"""
-        if article.get("summary") and len(article["summary"]) > 50:
+        if len(article.summary) > 50:
             return article
         
-        content = self.fetch_article_content(article["url"])
+        content = self.fetch_article_content(article.url)
         if content:
-            article["summary"] = content[:500]
+            article.summary = content[:500]
         
         return article
\ No newline at end of file
@@ -1,6 +1,8 @@
 from scrapers.base_scraper import BaseScraper
 
 class IWACUScraper(BaseScraper):
+    parser_backend = "lxml"
+
     def parse_articles(self, html):
         soup = self.get_soup(html)
         articles = []
@@ -31,19 +33,19 @@ class IWACUScraper(BaseScraper):
                 if parent:
                     img_tag = parent.select_one("img.wp-post-image, img")
                     if img_tag:
-                        image = img_tag.get("src") or img_tag.get("data-src") or ""
+                        image = self.resolve_image(img_tag, ("src", "data-src"))
                         if image.startswith("data:"):
                             image = ""
                         else:
                             image = self.make_absolute_url(image)
 
                 if headline and len(headline) > 15:
-                    articles.append({
-                        "headline": headline,
-                        "summary": summary[:500],
-                        "url": url,
-                        "image": image
-                    })
+                    articles.append(self.make_article(
+                        headline=headline,
+                        summary=summary[:500],
+                        url=url,
+                        image=image
+                    ))
             except Exception:
                 continue
 
@@ -59,7 +61,7 @@ class IWACUScraper(BaseScraper):
                     headline = self.clean_text(headline_tag.get_text())
                     
                     # Skip if already found
-                    if any(a["headline"] == headline for a in articles):
+                    if any(a.headline == headline for a in articles):
                         continue
                     
                     url = headline_tag.get("href", "")
@@ -69,19 +71,19 @@ class IWACUScraper(BaseScraper):
                     img_tag = item.select_one("img")
                     image = ""
                     if img_tag:
-                        image = img_tag.get("src") or img_tag.get("data-src") or ""
+                        image = self.resolve_image(img_tag, ("src", "data-src"))
                         if not image.startswith("data:"):
                             image = self.make_absolute_url(image)
                         else:
                             image = ""
 
                     if headline and len(headline) > 15:
-                        articles.append({
-                            "headline": headline,
-                            "summary": summary[:500],
-                            "url": url,
-                            "image": image
-                        })
+                        articles.append(self.make_article(
+                            headline=headline,
+                            summary=summary[:500],
+                            url=url,
+                            image=image
+                        ))
                 except Exception:
                     continue
 
@@ -0,0 +1,98 @@
+from functools import lru_cache
+import lxml.html
+from lxml import etree
+from cssselect import HTMLTranslator
+
+_translator = HTMLTranslator()
+
+
+@lru_cache(maxsize=512)
+def compile_selector(css):
+    """Compile a CSS selector to an XPath query once per process"""
+    return etree.XPath(_translator.css_to_xpath(css, prefix="descendant::"))
+
+
+class LxmlNode:
+    """
+    Thin wrapper around an lxml element exposing the small BeautifulSoup
+    surface our scrapers use (select, select_one, get_text, attributes,
+    find_parent). Selectors are compiled to XPath once and cached.
+    """
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    @property
+    def name(self):
+        return self.el.tag if isinstance(self.el.tag, str) else ""
+
+    def select(self, css):
+        return [LxmlNode(el) for el in compile_selector(css)(self.el)]
+
+    def select_one(self, css):
+        matches = compile_selector(css)(self.el)
+        return LxmlNode(matches[0]) if matches else None
+
+    def find_all(self, name):
+        return [LxmlNode(el) for el in self.el.iter(name) if el is not self.el]
+
+    def find_parent(self, name=None):
+        el = self.el.getparent()
+        while el is not None:
+            if name is None or el.tag == name:
+                return LxmlNode(el)
+            el = el.getparent()
+        return None
+
+    def find_next_sibling(self, name=None):
+        el = self.el.getnext()
+        while el is not None:
+            if name is None or el.tag == name:
+                return LxmlNode(el)
+            el = el.getnext()
+        return None
+
+    def get_text(self, separator="", strip=False):
+        if not separator and not strip:
+            return self.el.text_content()
+        parts = self.el.itertext()
+        if strip:
+            parts = [p.strip() for p in parts]
+            parts = [p for p in parts if p]
+        return separator.join(parts)
+
+    def get(self, key, default=None):
+        value = self.el.get(key)
+        if value is None:
+            return default
+        if key == "class":
+            return value.split()
+        return value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def decompose(self):
+        self.el.drop_tree()
+
+    def __eq__(self, other):
+        return isinstance(other, LxmlNode) and self.el is other.el
+
+    def __hash__(self):
+        return id(self.el)
+
+    def __str__(self):
+        return lxml.html.tostring(self.el, encoding="unicode")
+
+
+def parse_html(html):
+    """Parse HTML into an LxmlNode rooted at the document element"""
+    if isinstance(html, str):
+        # lxml refuses str input that carries an XML encoding declaration
+        html = html.encode("utf-8")
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    return LxmlNode(lxml.html.document_fromstring(html, parser=parser))
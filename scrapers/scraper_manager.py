@@ -1,29 +1,20 @@
-from scrapers.jeune_afrique import JeuneAfriqueScraper
-from scrapers.actualite_cd import ActualiteCDScraper
+import json
+
 from scrapers.iwacu import IWACUScraper
-from scrapers.punch import PunchScraper
-from scrapers.burkina24 import Burkina24Scraper
-from scrapers.abidjan_net import AbidjanNetScraper
 from scrapers.fratmat import FratmatScraper
 from scrapers.allafrica import AllAfricaScraper
-from scrapers.maliactu import MaliActuScraper
-from scrapers.seneweb import SenewebScraper
 from scrapers.generic_scraper import GenericScraper
+from scrapers.declarative_scraper import DeclarativeScraper, get_spec
 from scrapers.api_scrapers import GNewsAPIScraper, YouTubeAPIScraper, NewsAPIScraper, GoogleTrendsScraper
 from utils.logger import log_warning
 
+# Sites that need custom logic. Sites that only differ by selectors are
+# described in config/scraper_specs.json (or sources.scraper_spec) instead.
 SCRAPER_MAP = {
     # Custom web scrapers
-    "Jeune Afrique": JeuneAfriqueScraper,
-    "Actualite.cd": ActualiteCDScraper,
     "IWACU": IWACUScraper,
-    "Punch": PunchScraper,
-    "Burkina 24": Burkina24Scraper,
-    "Abidjan.net": AbidjanNetScraper,
     "Fratmat": FratmatScraper,
     "AllAfrica": AllAfricaScraper,
-    "Maliactu": MaliActuScraper,
-    "Seneweb": SenewebScraper,
     # API scrapers
     "GNews": GNewsAPIScraper,
     "YouTube": YouTubeAPIScraper,
@@ -32,9 +23,23 @@ SCRAPER_MAP = {
 }
 
 def get_scraper(source):
-    scraper_class = SCRAPER_MAP.get(source["name"], GenericScraper)
+    scraper = _build_scraper(source)
+    scraper.learned_selectors = _learned_selectors(source)
+    if source.get("max_pages"):
+        scraper.max_pages = source["max_pages"]
+    return scraper
+
+def _learned_selectors(source):
+    learned = source.get("learned_selectors") or {}
+    if isinstance(learned, str):
+        try:
+            learned = json.loads(learned)
+        except ValueError:
+            learned = {}
+    return learned if isinstance(learned, dict) else {}
 
-    return scraper_class(
+def _build_scraper(source):
+    kwargs = dict(
         source_id=source["id"],
         name=source["name"],
         url=source["url"],
@@ -42,4 +47,17 @@ def get_scraper(source):
         country_code=source["country_code"],
         language=source["language"],
         niche=source["niche"]
-    )
\ No newline at end of file
+    )
+
+    scraper_class = SCRAPER_MAP.get(source["name"])
+    if scraper_class:
+        return scraper_class(**kwargs)
+
+    spec = get_spec(source)
+    if spec:
+        try:
+            return DeclarativeScraper(spec=spec, **kwargs)
+        except ValueError as e:
+            log_warning(f"Invalid scraper spec for {source['name']}: {e}")
+
+    return GenericScraper(**kwargs)
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """A Database over a fresh in-memory fake client (utils/fake_supabase.py)"""
+    from utils import database
+    from utils.dedup_index import DedupIndex
+    from utils.fake_supabase import FakeClient
+    monkeypatch.setattr(database, "_client", FakeClient())
+    monkeypatch.setattr(database, "_missing_rpcs", set())
+    monkeypatch.setattr(database, "_missing_columns", set())
+    monkeypatch.setattr(database, "dedup_index", DedupIndex())
+    return database.Database()
@@ -0,0 +1,29 @@
+from scrapers.body_extractor import extract_body
+
+FRENCH_ARTICLE = """<html><head>
+<meta property="og:image" content="https://example.ci/photo.jpg">
+</head><body>
+<div class="article-body">
+  <p>Le président de la République a présidé mercredi le Conseil des ministres consacré à la réforme du code électoral.</p>
+  <p>Le communiqué publié à l'issue de la réunion annonce une consultation publique sur le découpage des circonscriptions.</p>
+  <p>La publication du décret au Journal officiel est attendue avant la fin du mois, selon le porte-parole du gouvernement.</p>
+  <p>Publicité : abonnez-vous à notre offre numérique pour lire tous nos articles.</p>
+  <p>Copyright © 2027 Fraternité Matin. Tous droits réservés. Reproduction interdite.</p>
+</div>
+</body></html>"""
+
+
+def test_french_body_keeps_republique_and_publie():
+    body, meta = extract_body(FRENCH_ARTICLE)
+    paragraphs = body.split("\n\n")
+    assert len(paragraphs) == 3
+    assert "République" in paragraphs[0]
+    assert "publié" in paragraphs[1] and "publique" in paragraphs[1]
+    assert "publication" in paragraphs[2]
+    assert meta["og:image"] == "https://example.ci/photo.jpg"
+
+
+def test_boilerplate_paragraphs_are_dropped():
+    body, _ = extract_body(FRENCH_ARTICLE)
+    assert "Publicité" not in body
+    assert "Tous droits réservés" not in body
@@ -0,0 +1,39 @@
+import glob
+import os
+from datetime import datetime, timedelta
+
+from utils.archive import read_rows
+
+
+def archived(folder):
+    return [row for path in sorted(glob.glob(os.path.join(folder, "content", "*"))) for row in read_rows(path)]
+
+
+def test_cleanup_archives_only_deleted_rows(fake_db, monkeypatch, tmp_path):
+    monkeypatch.setattr("utils.archive.ARCHIVE_DIR", str(tmp_path))
+    for n in range(3):
+        assert fake_db.add_content(1, f"Old headline number {n} to clean up", "x" * (900 if n == 0 else 50),
+                                   f"https://example.ci/old/{n}", f"https://example.ci/old/{n}.jpg",
+                                   "french", "Ivory Coast", "CI", "politics")
+    for row in fake_db.client.tables["content"]:
+        row["created_at"] = (datetime.utcnow() - timedelta(days=3)).isoformat()
+
+    # A poster leases row 3 between cleanup's select and its delete
+    bodies_for = fake_db._bodies_for
+    def claim_meanwhile(ids):
+        row = next(row for row in fake_db.client.tables["content"] if row["id"] == 3)
+        row["claimed_by"] = "other-host:1"
+        row["claimed_until"] = (datetime.utcnow() + timedelta(minutes=5)).isoformat()
+        return bodies_for(ids)
+    monkeypatch.setattr(fake_db, "_bodies_for", claim_meanwhile)
+
+    assert fake_db.cleanup_old_content(archive=True) == 2
+    rows = archived(str(tmp_path))
+    assert sorted(row["id"] for row in rows) == [1, 2]
+    assert len(next(row for row in rows if row["id"] == 1)["summary"]) == 900
+
+    # Once the lease lapses the row is archived exactly once
+    monkeypatch.setattr(fake_db, "_bodies_for", bodies_for)
+    fake_db.client.tables["content"][0]["claimed_until"] = (datetime.utcnow() - timedelta(minutes=1)).isoformat()
+    assert fake_db.cleanup_old_content(archive=True) == 1
+    assert sorted(row["id"] for row in archived(str(tmp_path))) == [1, 2, 3]
@@ -0,0 +1,77 @@
+"""
+Before/after check for BaseScraper.collect_containers on the saved
+Fratmat and AllAfrica homepages: the articles must match the per-selector
+loops it replaced.
+"""
+import os
+import json
+from scrapers.fratmat import FratmatScraper
+from scrapers.allafrica import AllAfricaScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+
+
+class LoopFratmat(FratmatScraper):
+    """Fratmat's original container loop: every selector's matches, concatenated"""
+    def collect_containers(self, soup, selectors, limit=None):
+        containers = []
+        for selector in selectors:
+            containers.extend(soup.select(selector))
+        return containers
+
+
+class LoopAllAfrica(AllAfricaScraper):
+    """AllAfrica's original container loop: selectors in order until 10 containers"""
+    def collect_containers(self, soup, selectors, limit=None):
+        containers = []
+        for selector in selectors:
+            found = soup.select(selector)
+            if found:
+                containers.extend(found)
+                if len(containers) >= 10:
+                    return containers[:10]
+        return containers
+
+
+def load(slug, scraper_class):
+    folder = os.path.join(FIXTURES_DIR, slug)
+    with open(os.path.join(folder, "source.json"), "r", encoding="utf-8") as f:
+        source = json.load(f)
+    with open(os.path.join(folder, "homepage.html"), "r", encoding="utf-8") as f:
+        html = f.read()
+    scraper = scraper_class(source["id"], source["name"], source["url"], source["country"],
+                            source["country_code"], source["language"], source["niche"])
+    return scraper, html
+
+
+def parsed(scraper, html):
+    return [(a.headline, a.url, a.image) for a in scraper.parse_articles(html)]
+
+
+def test_fratmat_matches_selector_loop():
+    scraper, html = load("fratmat", FratmatScraper)
+    before = parsed(load("fratmat", LoopFratmat)[0], html)
+    after = parsed(scraper, html)
+    assert after == before
+    # Cards whose only article-* child is an image wrapper are kept, with their image
+    assert len(after) == 12
+    assert all(image for _, _, image in after)
+
+
+def test_allafrica_keeps_priority_and_cap():
+    scraper, html = load("allafrica", AllAfricaScraper)
+    before = parsed(load("allafrica", LoopAllAfrica)[0], html)
+    after = parsed(scraper, html)
+    assert after == before
+    assert len(after) == 10
+
+
+def test_wrapper_gives_way_to_cards():
+    scraper, _ = load("fratmat", FratmatScraper)
+    html = """<div class="col-12">
+      <div class="item"><a href="/article/1">Premier titre assez long pour compter</a></div>
+      <div class="item"><a href="/article/2">Second titre assez long pour compter</a></div>
+    </div>"""
+    soup = scraper.get_soup(html)
+    containers = scraper.collect_containers(soup, ["div.col-12", "div.item"])
+    assert [c.get("class") for c in containers] == [["item"], ["item"]]
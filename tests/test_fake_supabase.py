@@ -0,0 +1,97 @@
+import pytest
+
+from utils.fake_supabase import FakeClient
+
+
+@pytest.fixture
+def client():
+    client = FakeClient()
+    client.table("content").insert([
+        {"headline_hash": "a", "original_url": "https://x/1", "status": "pending", "score": 3},
+        {"headline_hash": "b", "original_url": "https://x/2", "status": "posted", "score": 1},
+        {"headline_hash": "c", "original_url": "https://x/3", "status": "pending", "score": 2, "niche": None},
+    ]).execute()
+    return client
+
+
+def ids(response):
+    return [row["id"] for row in response.data]
+
+
+def test_insert_assigns_ids_and_created_at(client):
+    rows = client.table("content").select("*").execute().data
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert all(row["created_at"] for row in rows)
+
+
+def test_filters(client):
+    table = client.table
+    assert ids(table("content").select("id").eq("status", "pending").execute()) == [1, 3]
+    assert ids(table("content").select("id").neq("status", "pending").execute()) == [2]
+    assert ids(table("content").select("id").gt("score", 1).lte("score", 2).execute()) == [3]
+    assert ids(table("content").select("id").in_("headline_hash", ["a", "b"]).execute()) == [1, 2]
+    # NULL never matches a comparison
+    assert ids(table("content").select("id").neq("niche", "politics").execute()) == []
+
+
+def test_or_coerces_string_values(client):
+    response = client.table("content").select("id").or_("score.gte.3,status.eq.posted").execute()
+    assert ids(response) == [1, 2]
+
+
+def test_order_and_range(client):
+    response = client.table("content").select("id").order("score", desc=True).range(1, 2).execute()
+    assert ids(response) == [3, 2]
+
+
+def test_projection(client):
+    row = client.table("content").select("id, status").limit(1).execute().data[0]
+    assert row == {"id": 1, "status": "pending"}
+
+
+def test_count_and_head(client):
+    response = client.table("content").select("id", count="exact", head=True).eq("status", "pending").execute()
+    assert response.count == 2
+    assert response.data == []
+
+
+def test_update_and_delete_return_rows(client):
+    updated = client.table("content").update({"status": "failed"}).eq("id", 1).execute()
+    assert updated.data[0]["status"] == "failed"
+    deleted = client.table("content").delete().in_("id", [1, 2]).neq("status", "posted").execute()
+    assert ids(deleted) == [1]
+    assert ids(client.table("content").select("id").execute()) == [2, 3]
+
+
+def test_unique_keys(client):
+    with pytest.raises(Exception, match="23505"):
+        client.table("content").insert({"headline_hash": "a", "original_url": "https://x/9"}).execute()
+    with pytest.raises(Exception, match="content_original_url_key"):
+        client.table("content").insert([{"headline_hash": "y", "original_url": "https://x/8"},
+                                        {"headline_hash": "z", "original_url": "https://x/8"}]).execute()
+    # Failed inserts store nothing
+    assert len(client.tables["content"]) == 3
+
+
+def test_sqlite_persistence(tmp_path):
+    path = str(tmp_path / "fake.db")
+    first = FakeClient(path=path)
+    first.table("posts").insert({"facebook_post_id": "fb_1"}).execute()
+    first.table("posts").update({"likes": 5}).eq("facebook_post_id", "fb_1").execute()
+
+    second = FakeClient(path=path)
+    assert second.table("posts").select("facebook_post_id, likes").execute().data == [
+        {"facebook_post_id": "fb_1", "likes": 5}]
+    with pytest.raises(Exception, match="posts_facebook_post_id_key"):
+        second.table("posts").insert({"facebook_post_id": "fb_1"}).execute()
+
+
+def test_duplicate_insert_is_rejected_by_add_content(fake_db):
+    args = (1, "A headline long enough to be stored", "summary", "https://x/dup", "https://x/dup.jpg",
+            "french", "Ivory Coast", "CI", "politics")
+    assert fake_db.add_content(*args)
+    # Outside the dedup index window, only the unique index catches it
+    fake_db.content_exists = lambda headline_hash: False
+    fake_db.url_exists = lambda url: False
+    assert not fake_db.add_content(*args)
+    assert len(fake_db.client.tables["content"]) == 1
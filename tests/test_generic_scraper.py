@@ -0,0 +1,30 @@
+from benchmarks.parser_bench import load_fixture
+from scrapers.generic_scraper import GenericScraper
+
+
+def koaci_scraper(learned):
+    source, homepage, _ = load_fixture("koaci")
+    scraper = GenericScraper(source["id"], source["name"], source["url"], source["country"],
+                             source["country_code"], source["language"], source["niche"])
+    scraper.learned_selectors = learned
+    return scraper, homepage
+
+
+def test_learns_the_story_container():
+    scraper, homepage = koaci_scraper({})
+    assert len(scraper.parse_articles(homepage)) == 6
+    assert scraper.learned_selector_update() == {"article": [".news-item"]}
+
+
+def test_stale_container_is_replaced():
+    scraper, homepage = koaci_scraper({"article": [".entry"]})
+    assert len(scraper.parse_articles(homepage)) == 6
+    assert scraper.learned_selector_update() == {"article": [".news-item"]}
+
+
+def test_stale_container_is_dropped_when_nothing_replaces_it():
+    scraper, homepage = koaci_scraper({"article": [".entry"], "image": ["img.lazy"]})
+    # Same stories, no recognisable container around them any more
+    homepage = homepage.replace('class="news-item"', 'class="story"')
+    assert len(scraper.parse_articles(homepage)) == 6
+    assert scraper.learned_selector_update() == {"image": ["img.lazy"]}
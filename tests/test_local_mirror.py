@@ -0,0 +1,15 @@
+from utils import database, local_mirror
+
+
+def test_image_miss_is_confirmed_against_supabase(fake_db, monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "LOCAL_MIRROR_PATH", str(tmp_path / "mirror.db"))
+    monkeypatch.setattr(local_mirror, "_mirror", None)
+
+    fake_db.commit_post(1, "text", "french", "Ivory Coast", "politics", "https://img/1.jpg", "fb_1")
+    assert fake_db.is_image_used("https://img/1.jpg")
+    assert not fake_db.is_image_used("https://img/2.jpg")
+
+    # Another worker posts after our last sync; the mirror is still within max_age
+    fake_db.client.table("posts").insert({"image_used": "https://img/2.jpg", "facebook_post_id": "fb_2"}).execute()
+    assert not fake_db.mirror.image_used("https://img/2.jpg")
+    assert fake_db.is_image_used("https://img/2.jpg")
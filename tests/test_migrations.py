@@ -0,0 +1,21 @@
+import sqlite3
+
+from utils.migrations import list_migrations, migrate
+
+
+def test_sqlite_migrate_creates_indexes_once(tmp_path):
+    path = tmp_path / "schema.db"
+    url = f"sqlite:///{path}"
+
+    applied = migrate(url)
+    assert applied == [version for version, _ in list_migrations()]
+
+    conn = sqlite3.connect(path)
+    indexes = {row[0] for row in conn.execute("select name from sqlite_master where type = 'index'")}
+    conn.close()
+    for name in ("content_status_country_niche_idx", "content_pending_claim_idx", "content_headline_hash_key",
+                 "content_original_url_key", "content_created_at_idx", "posts_posted_at_idx",
+                 "posts_image_used_idx", "posts_facebook_post_id_key", "schedule_hour_idx"):
+        assert name in indexes
+
+    assert migrate(url) == []
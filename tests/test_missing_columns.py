@@ -0,0 +1,68 @@
+from utils import database
+from utils.fake_supabase import FakeClient, FakeQuery, _parse_or
+
+
+class PreMigrationQuery(FakeQuery):
+    """Rejects the columns migrations would add, the way PostgREST does"""
+
+    def _check(self, columns):
+        for column in columns:
+            if column in self.client.missing:
+                raise Exception(f"{{'code': 'PGRST204', 'message': \"Could not find the '{column}' column "
+                                f"of 'content' in the schema cache\"}}")
+
+    def insert(self, data):
+        self._check(data)
+        return super().insert(data)
+
+    def update(self, data):
+        self._check(data)
+        return super().update(data)
+
+    def _filter(self, column, op, value):
+        if column in self.client.missing:
+            raise Exception(f"{{'code': '42703', 'message': 'column content.{column} does not exist'}}")
+        return super()._filter(column, op, value)
+
+    def or_(self, expression):
+        if any(column in self.client.missing for column, _, _ in _parse_or(expression)):
+            raise Exception("{'code': '42703', 'message': 'column content.claimed_until does not exist'}")
+        return super().or_(expression)
+
+
+class PreMigrationClient(FakeClient):
+    missing = {"updated_at", "claimed_by", "claimed_until"}
+
+    def table(self, name):
+        return PreMigrationQuery(self, name)
+
+    def rpc(self, name, params=None):
+        raise Exception(f"PGRST202: Could not find the function public.{name}")
+
+
+def add(db, n):
+    return db.add_content(1, f"Headline number {n} long enough to store", "summary", f"https://example.ci/{n}",
+                          f"https://example.ci/{n}.jpg", "french", "Ivory Coast", "CI", "politics")
+
+
+def test_writes_work_before_migrations(fake_db, monkeypatch):
+    client = PreMigrationClient()
+    monkeypatch.setattr(database, "_client", client)
+
+    assert add(fake_db, 1)
+    assert "updated_at" not in client.tables["content"][0]
+
+    row = fake_db.claim_content()
+    assert row["id"] == 1
+    assert fake_db.mark_content_posting(row["id"])
+    assert client.tables["content"][0]["status"] == "posting"
+    assert database._missing_columns == {"updated_at", "claimed_by", "claimed_until"}
+
+
+def test_cleanup_works_before_migrations(fake_db, monkeypatch):
+    client = PreMigrationClient()
+    monkeypatch.setattr(database, "_client", client)
+    assert add(fake_db, 2)
+    client.tables["content"][0]["created_at"] = "2020-01-01T00:00:00"
+
+    assert fake_db.cleanup_old_content(archive=False) == 1
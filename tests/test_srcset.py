@@ -0,0 +1,22 @@
+from scrapers.base_scraper import parse_srcset
+
+
+def test_width_and_density_descriptors():
+    assert parse_srcset("a.jpg 400w, b.jpg 800w") == [("a.jpg", 400), ("b.jpg", 800)]
+    assert parse_srcset("a.jpg 1x, b.jpg 2x", base_width=300) == [("a.jpg", 300), ("b.jpg", 600)]
+    assert parse_srcset("a.jpg") == [("a.jpg", None)]
+    assert parse_srcset("") == [] and parse_srcset(None) == []
+
+
+def test_commas_inside_urls_are_kept():
+    srcset = ("https://res.cloudinary.com/x/image/upload/w_400,h_300,c_fill/a.jpg 400w,"
+              " https://res.cloudinary.com/x/image/upload/w_800,h_600,c_fill/a.jpg 800w")
+    assert parse_srcset(srcset) == [
+        ("https://res.cloudinary.com/x/image/upload/w_400,h_300,c_fill/a.jpg", 400),
+        ("https://res.cloudinary.com/x/image/upload/w_800,h_600,c_fill/a.jpg", 800),
+    ]
+
+
+def test_comma_after_url_ends_candidate():
+    assert parse_srcset("a.jpg, b.jpg 2x", base_width=100) == [("a.jpg", None), ("b.jpg", 200)]
+    assert parse_srcset("data:image/gif;base64,R0lGOD 1w, b.jpg 640w") == [("b.jpg", 640)]
@@ -0,0 +1,57 @@
+import os
+import json
+import gzip
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# One file per table per day, e.g. archive/content/2026-01-31.jsonl.zst
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "archive"))
+EXTENSION = ".jsonl.zst" if zstandard else ".jsonl.gz"
+
+
+def _day(row, day_key):
+    return str(row.get(day_key) or "unknown")[:10]
+
+
+def append_rows(table, rows, day_key="created_at", archive_dir=None):
+    """
+    Append rows as compressed JSON lines, partitioned by the date in day_key.
+    Each call adds one zstd frame (or gzip member) per day file; both formats
+    decompress concatenated frames as one stream, so files are append-only.
+    Returns the paths written.
+    """
+    folder = os.path.join(archive_dir or ARCHIVE_DIR, table)
+    os.makedirs(folder, exist_ok=True)
+
+    by_day = {}
+    for row in rows:
+        by_day.setdefault(_day(row, day_key), []).append(row)
+
+    paths = []
+    for day, day_rows in sorted(by_day.items()):
+        data = "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in day_rows).encode("utf-8")
+        path = os.path.join(folder, day + EXTENSION)
+        if zstandard:
+            with open(path, "ab") as f:
+                f.write(zstandard.ZstdCompressor(level=10).compress(data))
+        else:
+            with gzip.open(path, "ab", compresslevel=9) as f:
+                f.write(data)
+        paths.append(path)
+    return paths
+
+
+def read_rows(path):
+    """Iterate the rows stored in one archive file"""
+    if path.endswith(".zst"):
+        with open(path, "rb") as f:
+            reader = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+            for line in reader.read().decode("utf-8").splitlines():
+                yield json.loads(line)
+    else:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
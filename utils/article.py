@@ -0,0 +1,61 @@
+import sys
+
+LANGUAGE_ALIASES = {
+    "fr": "french",
+    "fr-fr": "french",
+    "francais": "french",
+    "français": "french",
+    "en": "english",
+    "en-us": "english",
+    "en-gb": "english",
+}
+
+
+def normalize_language(language):
+    """Map 'fr'/'en' style codes onto the 'french'/'english' names used everywhere else"""
+    if not language:
+        return ""
+    language = language.strip().lower()
+    return sys.intern(LANGUAGE_ALIASES.get(language, language))
+
+
+def _intern(value):
+    return sys.intern(value.strip()) if value else ""
+
+
+def _clean(value):
+    return value.strip() if isinstance(value, str) else ""
+
+
+class Article:
+    """
+    A scraped article candidate as it moves from scraper to database.
+    Strings are stripped once on construction; country, niche and language
+    are interned since thousands of candidates share a handful of values.
+    """
+    __slots__ = ("headline", "summary", "url", "image", "published_at",
+                 "country", "country_code", "language", "niche", "source_id")
+
+    def __init__(self, headline="", summary="", url="", image="", published_at="",
+                 country="", country_code="", language="", niche="", source_id=None):
+        self.headline = _clean(headline)
+        self.summary = _clean(summary)
+        self.url = _clean(url)
+        self.image = _clean(image)
+        self.published_at = _clean(published_at)
+        self.country = _intern(country)
+        self.country_code = _intern(country_code)
+        self.language = normalize_language(language)
+        self.niche = _intern(niche)
+        self.source_id = source_id
+
+    def get(self, key, default=None):
+        """Dict-style read for code that still treats articles as dicts"""
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value in (None, "") else value
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self):
+        return f"Article({self.headline[:40]!r}, {self.url!r})"
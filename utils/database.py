@@ -3,7 +3,17 @@ from supabase import create_client
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import hashlib
+import random
+import re
+import socket
+import threading
+import time
 from utils.logger import log_info, log_warning, log_error
+from utils.local_mirror import get_mirror
+from utils.archive import append_rows
+from utils.dedup_index import dedup_index
+from utils.table_cache import table_cache
+from config.settings import LOCAL_MIRROR_PATH, LOCAL_MIRROR_MAX_AGE, DEDUP_WINDOW_DAYS
 
 # Load .env file if it exists (for local development)
 load_dotenv()
@@ -11,46 +21,266 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL", "")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY", "")
 
+# "posting": handed to Facebook, not yet recorded by commit_post
+CONTENT_STATUSES = ["pending", "posting", "posted", "failed", "skipped_no_image"]
+POST_LANGUAGES = ["french", "english"]
+
+# Identifies this process in content leases (content.claimed_by)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+CLAIM_LEASE_SECONDS = 600
+# Content still 'posting' after this long was not recorded by commit_post (see reap_stale_posting)
+STALE_POSTING_MINUTES = 30
+
+# What selection needs from a content row; bodies are fetched separately (get_content_body)
+CONTENT_LIST_COLUMNS = "id, headline, image_url, source_language, country, country_code, niche, status, created_at"
+# Longer summaries are stored as a teaser plus a content_bodies row
+SUMMARY_MAX_CHARS = 500
+
+# sources and schedule change about weekly; cached reads (utils/table_cache.py) expire after this
+SOURCES_TTL = 3600
+SCHEDULE_TTL = 6 * 3600
+
+_client = None
+_client_lock = threading.Lock()
+_missing_rpcs = set()
+_missing_columns = set()
+
+# content columns added by migrations (leases, delta-sync stamp); writes drop
+# them once the database reports them missing, until `migrate` has run
+OPTIONAL_CONTENT_COLUMNS = {"claimed_by", "claimed_until", "updated_at"}
+# PGRST204 ("Could not find the 'x' column of 'content'") or Postgres 42703
+MISSING_COLUMN_RE = re.compile(r"Could not find the '(\w+)' column"
+                               r"|column \"?(?:\w+\.)?(\w+)\"?(?: of relation \"?\w+\"?)? does not exist")
+
+
+def get_client():
+    """The process-wide Supabase client, created on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if SUPABASE_URL.startswith(("memory://", "sqlite:///")):
+                    # Offline stand-in (utils/fake_supabase.py), no key needed
+                    from utils.fake_supabase import create_fake_client
+                    latency = float(os.getenv("FAKE_SUPABASE_LATENCY_MS", "0"))
+                    _client = create_fake_client(SUPABASE_URL, latency_ms=latency)
+                elif not SUPABASE_URL or not SUPABASE_KEY:
+                    raise Exception("SUPABASE_URL and SUPABASE_KEY must be set")
+                else:
+                    _client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    return _client
+
+
+def _missing_column(error):
+    """Column named by a missing-column error, else None"""
+    match = MISSING_COLUMN_RE.search(str(error))
+    return (match.group(1) or match.group(2)) if match else None
+
+
+def _present(fields):
+    """fields without the columns this database turned out not to have"""
+    return {column: value for column, value in fields.items() if column not in _missing_columns}
+
+
+def _unclaimed(query):
+    """Limit a content query to rows without an unexpired lease (all rows before leases exist)"""
+    if "claimed_until" in _missing_columns:
+        return query
+    now = datetime.utcnow().isoformat()
+    return query.or_(f"claimed_until.is.null,claimed_until.lt.{now}")
+
+
+def _project(row, columns):
+    """Limit a row dict to a PostgREST-style column list ("*" keeps everything)"""
+    if not columns or columns.strip() == "*":
+        return row
+    return {column.strip(): row.get(column.strip()) for column in columns.split(",")}
+
+
 class Database:
-    def __init__(self):
-        if not SUPABASE_URL or not SUPABASE_KEY:
-            raise Exception("SUPABASE_URL and SUPABASE_KEY must be set")
-        self.client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    """
+    Query helpers over the shared Supabase client. Constructing a Database
+    is free: every instance uses the same client and HTTP pool, and nothing
+    is created until the first query.
+    """
+    _slots = None
+    
+    @property
+    def client(self):
+        return get_client()
+    
+    @property
+    def mirror(self):
+        """The local SQLite mirror, delta-synced before use; None when disabled or unreachable"""
+        mirror = self._local_mirror()
+        if mirror is None:
+            return None
+        try:
+            mirror.refresh(self.client)
+            return mirror
+        except Exception as e:
+            log_warning(f"Local mirror sync failed, reading from Supabase: {e}")
+            return None
+    
+    def _local_mirror(self):
+        if not LOCAL_MIRROR_PATH:
+            return None
+        return get_mirror(LOCAL_MIRROR_PATH, max_age=LOCAL_MIRROR_MAX_AGE)
+    
+    def rpc(self, name, params, columns=None):
+        """
+        Call a database function from migrations/, optionally projecting the
+        returned rows. Returns None (once warned) when the function isn't
+        installed so callers can fall back.
+        """
+        if name in _missing_rpcs:
+            return None
+        try:
+            query = self.client.rpc(name, params)
+            if columns:
+                query = query.select(columns)
+            return query.execute().data
+        except Exception as e:
+            if "PGRST202" not in str(e) and "Could not find the function" not in str(e):
+                raise
+            log_warning(f"Database function {name} is not installed, using fallback queries")
+            _missing_rpcs.add(name)
+            return None
+    
+    def _note_missing_column(self, error):
+        """
+        True (once warned) when error reports one of OPTIONAL_CONTENT_COLUMNS
+        missing; it is then left out of later writes and filters.
+        """
+        column = _missing_column(error)
+        if column not in OPTIONAL_CONTENT_COLUMNS or column in _missing_columns:
+            return False
+        log_warning(f"content.{column} does not exist yet (run `python main.py migrate`), working without it")
+        _missing_columns.add(column)
+        return True
+    
+    def _without_missing_columns(self, run):
+        """run(), retried each time it fails on a newly found missing optional column"""
+        while True:
+            try:
+                return run()
+            except Exception as e:
+                if not self._note_missing_column(e):
+                    raise
+    
+    def _write_through(self, method, *args):
+        """Apply a write that already succeeded in Supabase to the local mirror"""
+        mirror = self._local_mirror()
+        if mirror is None:
+            return
+        try:
+            getattr(mirror, method)(*args)
+            mirror.commit()
+        except Exception as e:
+            log_warning(f"Local mirror write failed ({method}): {e}")
     
     def get_active_sources(self):
-        """Get all active sources"""
-        result = self.client.table("sources").select("*").eq("is_active", True).execute()
-        return result.data if result.data else []
+        """Get all active sources (cached for SOURCES_TTL)"""
+        def load():
+            result = self.client.table("sources").select("*").eq("is_active", True).execute()
+            return result.data if result.data else []
+        return table_cache.get("active_sources", SOURCES_TTL, load)
     
-    def get_pending_content(self, country_code=None, language=None, niche=None, limit=10):
-        """Get pending content with optional filters"""
-        # Only select items strictly marked as 'pending'
-        query = self.client.table("content").select("*").eq("status", "pending")
-        
-        if country_code and country_code != "Pan":
-            query = query.eq("country_code", country_code)
-        
-        if language:
-            query = query.eq("source_language", language)
-        
-        if niche:
-            query = query.eq("niche", niche)
-        
-        query = query.limit(limit)
-        result = query.execute()
+    def _update_source(self, source_id, fields):
+        """Write source fields and patch the cached copy to match"""
+        self.client.table("sources").update(fields).eq("id", source_id).execute()
+        def patch(sources):
+            for source in sources:
+                if source.get("id") == source_id:
+                    source.update(fields)
+        table_cache.update("active_sources", patch)
+    
+    def claim_content(self, country_code=None, language=None, niche=None, lease_seconds=CLAIM_LEASE_SECONDS,
+                      columns=CONTENT_LIST_COLUMNS):
+        """
+        Atomically lease one matching pending item to this worker, or None.
+        Leased items are invisible to other workers' claims until the lease
+        expires, so several posters can run side by side.
+        """
+        if country_code == "Pan":
+            country_code = None
+        rows = self.rpc("claim_content", {
+            "worker": WORKER_ID,
+            "lease_seconds": lease_seconds,
+            "p_country_code": country_code,
+            "p_language": language,
+            "p_niche": niche,
+        }, columns)
+        if rows is None:
+            row = self._claim_with_updates(country_code, language, niche, lease_seconds)
+            return _project(row, columns) if row else None
+        return rows[0] if rows else None
+    
+    def _claim_with_updates(self, country_code, language, niche, lease_seconds):
+        """
+        claim_content without the RPC: a conditional update only one worker can
+        win. Before the lease columns are migrated it returns a pending row
+        unleased, as selection did before leases.
+        """
+        return self._without_missing_columns(lambda: self._lease_candidate(country_code, language, niche, lease_seconds))
+    
+    def _lease_candidate(self, country_code, language, niche, lease_seconds):
+        leased = not _missing_columns & {"claimed_by", "claimed_until"}
+        query = _unclaimed(self.client.table("content").select("id" if leased else "*").eq("status", "pending"))
+        for column, value in (("country_code", country_code), ("source_language", language), ("niche", niche)):
+            if value:
+                query = query.eq(column, value)
+        # Newest first like the RPC; shuffled so concurrent workers rarely race for the same row
+        candidates = query.order("id", desc=True).limit(5).execute().data or []
+        random.shuffle(candidates)
+        if not leased:
+            return candidates[0] if candidates else None
         
-        return result.data if result.data else []
+        lease = _present({
+            "claimed_by": WORKER_ID,
+            "claimed_until": (datetime.utcnow() + timedelta(seconds=lease_seconds)).isoformat(),
+            "updated_at": datetime.utcnow().isoformat()
+        })
+        for candidate in candidates:
+            result = _unclaimed(self.client.table("content").update(lease).eq("id", candidate["id"])
+                                .eq("status", "pending")).execute()
+            if result.data:
+                return result.data[0]
+        return None
+    
+    def get_content_body(self, content_id):
+        """Full text for one content item: its content_bodies row, else the stored summary"""
+        try:
+            result = self.client.table("content_bodies").select("body").eq("content_id", content_id).execute()
+            if result.data:
+                return result.data[0]["body"]
+        except Exception as e:
+            log_warning(f"Could not read body for content {content_id}: {e}")
+        result = self.client.table("content").select("summary").eq("id", content_id).execute()
+        return result.data[0].get("summary") or "" if result.data else ""
     
     def get_current_schedule(self):
         """Get schedule for current hour"""
-        current_hour = datetime.utcnow().hour
-        result = self.client.table("schedule").select("*").eq("hour_utc", current_hour).eq("is_active", True).execute()
-        return result.data[0] if result.data else None
+        return self.get_schedule_slots()[datetime.utcnow().hour]
     
     def get_full_schedule(self):
-        """Get full 24-hour schedule"""
-        result = self.client.table("schedule").select("*").order("hour_utc").execute()
-        return result.data if result.data else []
+        """Get full 24-hour schedule (cached for SCHEDULE_TTL)"""
+        def load():
+            result = self.client.table("schedule").select("*").order("hour_utc").execute()
+            return result.data if result.data else []
+        return table_cache.get("schedule", SCHEDULE_TTL, load)
+    
+    def get_schedule_slots(self):
+        """24 entries indexed by UTC hour: the first active schedule row for that hour, or None"""
+        schedule = self.get_full_schedule()
+        if self._slots is None or self._slots[0] is not schedule:
+            slots = [None] * 24
+            for row in schedule:
+                hour = row.get("hour_utc")
+                if row.get("is_active") and isinstance(hour, int) and 0 <= hour < 24 and slots[hour] is None:
+                    slots[hour] = row
+            self._slots = (schedule, slots)
+        return self._slots[1]
     
     def add_content(self, source_id, headline, summary, original_url, image_url, source_language, country, country_code, niche, initial_image_url=None):
         """Add new content to database with initial image URL"""
@@ -71,10 +301,14 @@ class Database:
             log_warning(f"Rejected article - Duplicate URL: {original_url}")
             return False
         
+        # Keep list reads light: long text goes to content_bodies, a teaser stays in summary
+        body = summary if summary and len(summary) > SUMMARY_MAX_CHARS else None
+        
+        now = datetime.utcnow().isoformat()
         data = {
             "source_id": source_id,
             "headline": headline,
-            "summary": summary,
+            "summary": summary[:SUMMARY_MAX_CHARS] if body else summary,
             "original_url": original_url,
             "image_url": image_url,
             "initial_image_url": initial_image_url or image_url,  # Fallback to image_url if not provided
@@ -84,19 +318,81 @@ class Database:
             "niche": niche,
             "status": "pending",
             "headline_hash": headline_hash,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": now,
+            "updated_at": now
         }
         
         try:
-            result = self.client.table("content").insert(data).execute()
+            result = self._without_missing_columns(
+                lambda: self.client.table("content").insert(_present(data)).execute())
+            if result.data:
+                if body:
+                    self._store_body(result.data[0]["id"], body)
+            dedup_index.add(headline_hash)
+            dedup_index.add(original_url)
             log_info(f"Successfully inserted article into database: {headline[:50]}...")
             return True
         except Exception as e:
+            if "23505" in str(e) or "duplicate key" in str(e):
+                # Older than the dedup index window; caught by the unique indexes
+                log_warning(f"Rejected article - Duplicate of older content: {headline[:50]}...")
+                return False
             log_error(f"Database error while inserting article: {e}")
             return False
     
+    def _store_body(self, content_id, body):
+        try:
+            self.client.table("content_bodies").insert({"content_id": content_id, "body": body}).execute()
+        except Exception as e:
+            # content_bodies not migrated yet: keep the full text in summary as before
+            log_warning(f"Could not store body separately for content {content_id}: {e}")
+            try:
+                self._update_content(content_id, {"summary": body})
+            except Exception as e:
+                # The row is in; it keeps its teaser rather than failing the insert
+                log_warning(f"Could not store full summary for content {content_id}: {e}")
+    
+    def _bodies_for(self, content_ids):
+        """{content_id: body} for the given ids; empty if content_bodies is unavailable"""
+        try:
+            result = self.client.table("content_bodies").select("content_id, body")\
+                .in_("content_id", content_ids).execute()
+            return {row["content_id"]: row["body"] for row in result.data or []}
+        except Exception as e:
+            log_warning(f"Could not read content bodies: {e}")
+            return {}
+    
+    def add_article(self, article, image_url=None, summary=None):
+        """Add an Article record (utils.article.Article) as new content"""
+        return self.add_content(
+            source_id=article.source_id,
+            headline=article.headline,
+            summary=article.summary if summary is None else summary,
+            original_url=article.url,
+            image_url=image_url or article.image,
+            source_language=article.language,
+            country=article.country,
+            country_code=article.country_code,
+            niche=article.niche or "general",
+            initial_image_url=article.image or None
+        )
+    
+    def load_dedup_index(self, days=DEDUP_WINDOW_DAYS):
+        """
+        Fingerprint the headline_hash and original_url of content created in
+        the last `days` in one paged read, so content_exists/url_exists only
+        query for possible duplicates. Posted rows are never cleaned up, so
+        the window keeps the load bounded; a story older than that coming
+        back is rejected by the unique indexes when it is inserted.
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        dedup_index.load(self.iter_rows("content", [("gte", "created_at", cutoff)],
+                                        columns="id, headline_hash, original_url"))
+    
     def content_exists(self, headline_hash):
         """Check if content already exists"""
+        if not dedup_index.might_contain(headline_hash):
+            return False
         result = self.client.table("content").select("id").eq("headline_hash", headline_hash).execute()
         return len(result.data) > 0 if result.data else False
     
@@ -104,27 +400,91 @@ class Database:
         """Check if content with same URL already exists"""
         if not url:
             return False
+        if not dedup_index.might_contain(url):
+            return False
         result = self.client.table("content").select("id").eq("original_url", url).execute()
         return len(result.data) > 0 if result.data else False
     
+    def existing_urls(self, urls):
+        """Subset of urls that are already stored as content"""
+        urls = [url for url in urls if url and dedup_index.might_contain(url)]
+        if not urls:
+            return set()
+        result = self.client.table("content").select("original_url").in_("original_url", urls).execute()
+        return {row["original_url"] for row in result.data or []}
+    
     def create_headline_hash(self, headline):
         """Create hash of headline for duplicate detection"""
         normalized = " ".join(headline.lower().split())
         return hashlib.sha256(normalized.encode()).hexdigest()
     
+    def _update_content(self, content_id, fields, **conditions):
+        """
+        Write content fields to one row, stamping updated_at so changed rows
+        can be found. conditions (column=value) must also match.
+        """
+        def run():
+            query = self.client.table("content").update(_present({**fields, "updated_at": datetime.utcnow().isoformat()}))
+            query = query.eq("id", content_id)
+            for column, value in _present(conditions).items():
+                query = query.eq(column, value)
+            return query.execute()
+        return self._without_missing_columns(run)
+    
+    def mark_content_posting(self, content_id):
+        """
+        Move content this worker has leased from pending to posting before it
+        goes to Facebook. Claims and cleanup skip posting rows, so an expired
+        lease can't hand a live post to another worker. False if the row is
+        no longer pending or leased to someone else.
+        """
+        result = self._update_content(content_id, {"status": "posting"}, status="pending", claimed_by=WORKER_ID)
+        return bool(result.data)
+    
+    def stale_posting_content(self, minutes=STALE_POSTING_MINUTES):
+        """Content that has been 'posting' for more than minutes"""
+        cutoff = (datetime.utcnow() - timedelta(minutes=minutes)).isoformat()
+        def run():
+            column = "created_at" if "updated_at" in _missing_columns else "updated_at"
+            return self.client.table("content").select("id, headline, image_url").eq("status", "posting")\
+                .lt(column, cutoff).order("id").execute().data or []
+        return self._without_missing_columns(run)
+    
+    def reap_stale_posting(self, minutes=STALE_POSTING_MINUTES):
+        """
+        Settle stale 'posting' content. Rows whose post was recorded are marked
+        posted; the rest may be live on Facebook without a posts row, so they
+        stay 'posting' (never re-posted) and are logged for a manual check.
+        Returns the number of rows marked posted.
+        """
+        stale = self.stale_posting_content(minutes)
+        if not stale:
+            return 0
+        result = self.client.table("posts").select("content_id").in_("content_id", [row["id"] for row in stale]).execute()
+        recorded = {row["content_id"] for row in result.data or []}
+        for row in stale:
+            if row["id"] in recorded:
+                self._update_content(row["id"], {"status": "posted"}, status="posting")
+            else:
+                log_warning(f"Content {row['id']} has been posting for over {minutes} min with no post recorded; "
+                            f"check Facebook for \"{(row.get('headline') or '')[:50]}\" ({row.get('image_url')})")
+        if recorded:
+            log_info(f"Marked {len(recorded)} stale posting items as posted")
+        return len(recorded)
+    
     def mark_content_posted(self, content_id):
         """Mark content as posted"""
-        self.client.table("content").update({
+        self._update_content(content_id, {
             "status": "posted"
-        }).eq("id", content_id).execute()
+        })
     
     def mark_content_failed(self, content_id):
         """Mark content as failed"""
-        self.client.table("content").update({"status": "failed"}).eq("id", content_id).execute()
+        self._update_content(content_id, {"status": "failed"})
 
     def mark_content_skipped_image(self, content_id):
         """Mark content as skipped due to invalid/missing image"""
-        self.client.table("content").update({"status": "skipped_no_image"}).eq("id", content_id).execute()
+        self._update_content(content_id, {"status": "skipped_no_image"})
     
     def is_content_posted(self, content_id):
         """Check if content has already been posted"""
@@ -137,6 +497,11 @@ class Database:
         """Check if this specific image URL has been used in a previous post"""
         if not image_url:
             return True 
+        
+        # A hit in the mirror is final; a miss may be a post another worker made since the last sync
+        mirror = self.mirror
+        if mirror is not None and mirror.image_used(image_url):
+            return True
             
         result = self.client.table("posts").select("id").eq("image_used", image_url).execute()
         return len(result.data) > 0 if result.data else False
@@ -157,20 +522,93 @@ class Database:
             "posted_at": datetime.utcnow().isoformat()
         }
         
-        self.client.table("posts").insert(data).execute()
+        result = self.client.table("posts").insert(data).execute()
+        if result.data:
+            self._write_through("upsert_post", result.data[0])
         return True
     
+    def commit_post(self, content_id, post_text, post_language, target_country, niche, image_used, facebook_post_id):
+        """
+        Record a published post and mark its content posted, atomically via
+        the commit_post RPC. Safe to retry: a facebook_post_id that is
+        already recorded returns the existing post.
+        """
+        post = self.rpc("commit_post", {
+            "p_content_id": content_id,
+            "p_post_text": post_text,
+            "p_post_language": post_language,
+            "p_target_country": target_country,
+            "p_niche": niche,
+            "p_image_used": image_used,
+            "p_facebook_post_id": facebook_post_id,
+        })
+        if post is None:
+            # RPC not installed: same steps as separate requests
+            existing = self.client.table("posts").select("*").eq("facebook_post_id", facebook_post_id).execute().data
+            if existing:
+                post = existing[0]
+            else:
+                post = self.client.table("posts").insert({
+                    "content_id": content_id,
+                    "post_text": post_text,
+                    "post_language": post_language,
+                    "target_country": target_country,
+                    "niche": niche,
+                    "image_used": image_used,
+                    "facebook_post_id": facebook_post_id,
+                    "posted_at": datetime.utcnow().isoformat()
+                }).execute().data[0]
+            self._update_content(content_id, {"status": "posted"})
+        
+        self._write_through("upsert_post", post)
+        return post
+    
     def get_recent_posts(self, limit=10):
         """Get recent posts"""
         result = self.client.table("posts").select("*").order("posted_at", desc=True).limit(limit).execute()
         return result.data if result.data else []
     
+    def iter_rows(self, table, filters=None, order_key="id", page_size=1000, columns="*"):
+        """
+        Stream every matching row using keyset pagination on order_key (which
+        must be unique, e.g. id). filters is a list of (operator, column, value)
+        such as ("gte", "posted_at", cutoff). page_size must not exceed the
+        server's max-rows setting (1000 on Supabase) or paging stops early.
+        """
+        if columns != "*" and order_key not in [c.strip() for c in columns.split(",")]:
+            columns += f", {order_key}"
+        last = None
+        while True:
+            query = self.client.table(table).select(columns)
+            for operator, column, value in filters or []:
+                query = getattr(query, operator)(column, value)
+            if last is not None:
+                query = query.gt(order_key, last)
+            rows = query.order(order_key).limit(page_size).execute().data or []
+            yield from rows
+            if len(rows) < page_size:
+                return
+            last = rows[-1][order_key]
+    
+    def get_posts_since(self, cutoff, columns=None):
+        """Iterate posts made at or after cutoff (ISO timestamp), optionally only some columns"""
+        mirror = self.mirror
+        if mirror is not None and mirror.covers(cutoff):
+            return iter(mirror.posts_since(cutoff, columns))
+        
+        select = ", ".join(columns) if columns else "*"
+        return self.iter_rows("posts", [("gte", "posted_at", cutoff)], columns=select)
+    
+    def update_post_metrics(self, facebook_post_id, metrics):
+        """Store Facebook insights for a post"""
+        fields = {**metrics, "metrics_updated_at": datetime.utcnow().isoformat()}
+        self.client.table("posts").update(fields).eq("facebook_post_id", facebook_post_id).execute()
+        self._write_through("update_post", facebook_post_id, fields)
+    
     def get_language_ratio(self, hours=24):
         """Get current language ratio for specified hours"""
         cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
-        
-        result = self.client.table("posts").select("post_language").gte("posted_at", cutoff).execute()
-        posts = result.data if result.data else []
+        posts = self.get_posts_since(cutoff, ["post_language"])
         
         french = sum(1 for p in posts if p.get("post_language") == "french")
         english = sum(1 for p in posts if p.get("post_language") == "english")
@@ -191,9 +629,54 @@ class Database:
     
     def update_source_scraped(self, source_id):
         """Update last scraped timestamp for source"""
-        self.client.table("sources").update({
+        self._update_source(source_id, {
             "last_scraped": datetime.utcnow().isoformat()
-        }).eq("id", source_id).execute()
+        })
+    
+    def update_source_selectors(self, source_id, learned_selectors):
+        """Persist the selectors that produced results for a source"""
+        self._update_source(source_id, {
+            "learned_selectors": learned_selectors
+        })
+    
+    def update_source_feed(self, source_id, feed_url):
+        """Persist a source's discovered feed URL ("" = probed, none found)"""
+        self._update_source(source_id, {
+            "feed_url": feed_url
+        })
+    
+    def count(self, table, **filters):
+        """Row count computed by the server; no rows are transferred"""
+        query = self.client.table(table).select("id", count="exact", head=True)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        return query.execute().count or 0
+    
+    def get_dashboard_stats(self):
+        """
+        Pending count, posts since midnight UTC (total and by language) and
+        content counts by status. Uses the dashboard_stats RPC when it is
+        installed (migrations/001_dashboard_stats.sql), otherwise one
+        head-only count query per figure.
+        """
+        today = datetime.utcnow().date().isoformat()
+        stats = self.rpc("dashboard_stats", {"since": today})
+        if stats:
+            return stats
+        
+        def posts_today(language=None):
+            query = self.client.table("posts").select("id", count="exact", head=True).gte("posted_at", today)
+            if language:
+                query = query.eq("post_language", language)
+            return query.execute().count or 0
+        
+        by_status = {status: self.count("content", status=status) for status in CONTENT_STATUSES}
+        return {
+            "pending": by_status["pending"],
+            "posts_today": posts_today(),
+            "posts_by_language": {language: posts_today(language) for language in POST_LANGUAGES},
+            "content_by_status": by_status,
+        }
     
     def get_sources_needing_scrape(self, hours=4):
         """Get sources that need scraping"""
@@ -205,39 +688,65 @@ class Database:
         
         return result.data if result.data else []
 
-    def cleanup_old_content(self, hours=48):
-        """Delete content older than X hours that hasn't been posted"""
+    def cleanup_old_content(self, hours=48, batch_size=500, time_budget=300, archive=True):
+        """
+        Delete content older than X hours that isn't posted or posting, in
+        batches of batch_size ordered by id. The rows each delete removed are
+        appended to the compressed archive (utils/archive.py), full bodies
+        included. Rows under an unexpired lease are left alone, and the
+        delete re-checks both conditions so a row claimed or posted after the
+        select survives. Stops once time_budget seconds have passed; the next
+        run picks up the rest.
+        """
         cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+        started = time.time()
+        deleted = 0
         
         try:
-            # First, get the count of items to be deleted for logging
-            count_result = self.client.table("content")\
-                .select("id", count="exact")\
-                .lt("created_at", cutoff)\
-                .neq("status", "posted")\
-                .execute()
+            # Planner estimate only: an exact count scans everything we are about to delete
+            estimate = self.client.table("content").select("id", count="estimated", head=True)\
+                .lt("created_at", cutoff).neq("status", "posted").neq("status", "posting").execute().count or 0
+            log_info(f"Cleaning up ~{estimate} old content items (older than {hours} hours)")
             
-            count = count_result.count if hasattr(count_result, 'count') else 0
-            
-            if count > 0:
-                log_info(f"Cleaning up {count} old content items (older than {hours} hours)")
+            while True:
+                if time_budget and time.time() - started > time_budget:
+                    log_warning(f"Cleanup stopped after {time_budget}s time budget; rest left for next run")
+                    break
+                
+                rows = self._without_missing_columns(lambda: _unclaimed(
+                    self.client.table("content").select("*")
+                    .lt("created_at", cutoff).neq("status", "posted").neq("status", "posting"))
+                    .order("id").limit(batch_size).execute().data) or []
+                if not rows:
+                    break
                 
-                # Now perform the actual deletion
-                result = self.client.table("content")\
-                    .delete()\
-                    .lt("created_at", cutoff)\
-                    .neq("status", "posted")\
-                    .execute()
+                ids = [row["id"] for row in rows]
+                # content_bodies rows go with the cascade: read them first to archive the full text
+                bodies = self._bodies_for(ids) if archive else {}
+                result = _unclaimed(self.client.table("content").delete().in_("id", ids)
+                                    .neq("status", "posted").neq("status", "posting")).execute()
+                removed = len(result.data or [])
+                if archive and removed:
+                    # Only what was deleted, so rows kept (or a failed delete) aren't archived twice
+                    append_rows("content", [dict(row, summary=bodies.get(row["id"], row.get("summary")))
+                                            for row in result.data])
+                if removed < len(ids):
+                    log_warning(f"Cleanup kept {len(ids) - removed} rows claimed or posted since they were selected")
                 
-                log_info(f"Successfully deleted {count} old content items")
+                deleted += removed
+                log_info(f"Cleanup progress: {deleted}/~{estimate} deleted ({time.time() - started:.1f}s)")
+                if len(rows) < batch_size:
+                    break
+            
+            if deleted:
+                log_info(f"Successfully deleted {deleted} old content items")
             else:
                 log_info("No old content items to clean up")
-                
-            return count
+            return deleted
             
         except Exception as e:
-            log_error(f"Error during content cleanup: {e}")
-            return 0
+            log_error(f"Error during content cleanup after {deleted} items: {e}")
+            return deleted
 
     def clear_all_content(self):
         """Delete all content from the database. Use with caution!"""
@@ -0,0 +1,53 @@
+import hashlib
+from array import array
+from bisect import bisect_left
+from utils.logger import log_info
+
+
+def hash64(value):
+    """64-bit fingerprint of a headline hash or URL"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class DedupIndex:
+    """
+    Sorted array of 64-bit fingerprints of the headline_hash and
+    original_url values loaded (recent content). A miss means the value is
+    not among them; a hit only means it may exist, so callers confirm hits
+    against the database.
+    """
+
+    def __init__(self):
+        self.hashes = array("Q")
+        self.added = set()
+        self.loaded = False
+
+    def load(self, rows):
+        """Build from rows carrying headline_hash and original_url"""
+        hashes = array("Q")
+        for row in rows:
+            for key in ("headline_hash", "original_url"):
+                if row.get(key):
+                    hashes.append(hash64(row[key]))
+        self.hashes = array("Q", sorted(hashes))
+        self.added = set()
+        self.loaded = True
+        log_info(f"Dedup index loaded: {len(self.hashes)} fingerprints ({self.hashes.itemsize * len(self.hashes) // 1024} KB)")
+
+    def add(self, value):
+        """Record a value stored during this run"""
+        if value:
+            self.added.add(hash64(value))
+
+    def might_contain(self, value):
+        """False only when value is certainly not stored yet (or the index isn't loaded)"""
+        if not self.loaded:
+            return True
+        fingerprint = hash64(value)
+        if fingerprint in self.added:
+            return True
+        i = bisect_left(self.hashes, fingerprint)
+        return i < len(self.hashes) and self.hashes[i] == fingerprint
+
+
+dedup_index = DedupIndex()
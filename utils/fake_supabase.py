@@ -0,0 +1,289 @@
+"""
+In-process stand-in for the Supabase client, for offline runs and
+benchmarks. Implements the part of the PostgREST builder this project
+uses; database functions are served by utils/rpc_standins.py.
+
+Selected by SUPABASE_URL: "memory://" keeps everything in memory,
+"sqlite:///path/to.db" also persists tables to a SQLite file.
+FAKE_SUPABASE_LATENCY_MS adds a sleep per round-trip so benchmarks
+reflect how many requests a code path makes.
+"""
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from utils.rpc_standins import RPC_STANDINS
+
+# The unique indexes from migrations/004 and 005: {table: {column: index name}}
+UNIQUE_KEYS = {
+    "content": {"headline_hash": "content_headline_hash_key", "original_url": "content_original_url_key"},
+    "posts": {"facebook_post_id": "posts_facebook_post_id_key"},
+}
+
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+def _coerce(value, sample):
+    """PostgREST filter values arrive as strings inside or_(); match the column's type"""
+    if isinstance(value, str) and isinstance(sample, (int, float)) and not isinstance(sample, bool):
+        try:
+            return type(sample)(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _compare(op, actual, expected):
+    if op == "is":
+        return actual is None if expected in (None, "null") else actual == expected
+    # SQL semantics: any comparison with NULL is not true
+    if actual is None:
+        return False
+    expected = _coerce(expected, actual)
+    if op == "eq":
+        return actual == expected
+    if op == "neq":
+        return actual != expected
+    if op == "gt":
+        return actual > expected
+    if op == "gte":
+        return actual >= expected
+    if op == "lt":
+        return actual < expected
+    if op == "lte":
+        return actual <= expected
+    if op == "in":
+        return actual in [_coerce(v, actual) for v in expected]
+    raise ValueError(f"Unsupported filter operator: {op}")
+
+
+def _parse_or(expression):
+    """'status.eq.pending,created_at.gte.2026-01-01' -> [(column, op, value), ...]"""
+    conditions = []
+    for part in expression.split(","):
+        column, op, value = part.split(".", 2)
+        conditions.append((column, op, value))
+    return conditions
+
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.action = "select"
+        self.columns = "*"
+        self.payload = None
+        self.count_method = None
+        self.head = False
+        self.filters = []
+        self.ordering = []
+        self.row_limit = None
+        self.offset = 0
+
+    # --- actions ---
+
+    def select(self, *columns, count=None, head=None):
+        self.columns = ",".join(columns) or "*"
+        self.count_method = count
+        self.head = bool(head)
+        return self
+
+    def insert(self, data):
+        self.action = "insert"
+        self.payload = data
+        return self
+
+    def update(self, data):
+        self.action = "update"
+        self.payload = data
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    # --- filters and modifiers ---
+
+    def _filter(self, column, op, value):
+        self.filters.append(lambda row: _compare(op, row.get(column), value))
+        return self
+
+    def eq(self, column, value):
+        return self._filter(column, "eq", value)
+
+    def neq(self, column, value):
+        return self._filter(column, "neq", value)
+
+    def gt(self, column, value):
+        return self._filter(column, "gt", value)
+
+    def gte(self, column, value):
+        return self._filter(column, "gte", value)
+
+    def lt(self, column, value):
+        return self._filter(column, "lt", value)
+
+    def lte(self, column, value):
+        return self._filter(column, "lte", value)
+
+    def in_(self, column, values):
+        return self._filter(column, "in", list(values))
+
+    def or_(self, expression):
+        conditions = _parse_or(expression)
+        self.filters.append(lambda row: any(_compare(op, row.get(column), value)
+                                            for column, op, value in conditions))
+        return self
+
+    def order(self, column, desc=False):
+        self.ordering.append((column, desc))
+        return self
+
+    def limit(self, count):
+        self.row_limit = count
+        return self
+
+    def range(self, start, end):
+        self.offset = start
+        self.row_limit = end - start + 1
+        return self
+
+    # --- execution ---
+
+    def _project(self, row):
+        if self.columns.strip() == "*":
+            return dict(row)
+        return {c.strip(): row.get(c.strip()) for c in self.columns.split(",")}
+
+    def execute(self):
+        self.client.round_trip()
+        with self.client.lock:
+            rows = self.client.tables.setdefault(self.table, [])
+            if self.action == "insert":
+                return FakeResponse(self.client.insert_rows(self.table, self.payload))
+
+            matched = [row for row in rows if all(check(row) for check in self.filters)]
+            if self.action == "update":
+                for row in matched:
+                    row.update(self.payload)
+                self.client.persist(self.table)
+                return FakeResponse([dict(row) for row in matched])
+            if self.action == "delete":
+                ids = {id(row) for row in matched}
+                self.client.tables[self.table] = [row for row in rows if id(row) not in ids]
+                self.client.persist(self.table)
+                return FakeResponse([dict(row) for row in matched])
+
+            for column, desc in reversed(self.ordering):
+                matched.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+            count = len(matched) if self.count_method else None
+            if self.head:
+                return FakeResponse([], count)
+            end = None if self.row_limit is None else self.offset + self.row_limit
+            return FakeResponse([self._project(row) for row in matched[self.offset:end]], count)
+
+
+class FakeRpc:
+    def __init__(self, client, name, params):
+        self.client = client
+        self.name = name
+        self.params = params or {}
+        self.columns = "*"
+
+    def select(self, *columns):
+        self.columns = ",".join(columns) or "*"
+        return self
+
+    def execute(self):
+        self.client.round_trip()
+        standin = RPC_STANDINS.get(self.name)
+        if standin is None:
+            raise Exception(f"PGRST202: Could not find the function public.{self.name}")
+        with self.client.lock:
+            data = standin(self.client.tables, self.params)
+            self.client.persist()
+        if isinstance(data, list) and self.columns.strip() != "*":
+            names = [column.strip() for column in self.columns.split(",")]
+            data = [{name: row.get(name) for name in names} for row in data]
+        return FakeResponse(data)
+
+
+class FakeClient:
+    """Drop-in for supabase.Client covering table() and rpc()"""
+
+    def __init__(self, path=None, latency_ms=0):
+        self.path = path
+        self.latency = latency_ms / 1000.0
+        self.round_trips = 0
+        self.lock = threading.RLock()
+        self.tables = {}
+        self.next_ids = {}
+        self.conn = None
+        if path:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.execute("create table if not exists rows (tbl text, id integer, data text, primary key (tbl, id))")
+            for tbl, data in self.conn.execute("select tbl, data from rows order by tbl, id"):
+                self.tables.setdefault(tbl, []).append(json.loads(data))
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params=None):
+        return FakeRpc(self, name, params)
+
+    def round_trip(self):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _check_unique(self, table, rows):
+        """Raise like PostgREST (23505) if rows would break one of UNIQUE_KEYS; nothing is inserted"""
+        for column, index in UNIQUE_KEYS.get(table, {}).items():
+            seen = {row.get(column) for row in self.tables.get(table, [])}
+            for row in rows:
+                value = row.get(column)
+                if value is None:
+                    continue
+                if value in seen:
+                    raise Exception(f"{{'code': '23505', 'message': 'duplicate key value violates unique "
+                                    f"constraint \"{index}\"', 'details': 'Key ({column})=({value}) already exists.'}}")
+                seen.add(value)
+
+    def insert_rows(self, table, payload):
+        rows = payload if isinstance(payload, list) else [payload]
+        self._check_unique(table, rows)
+        stored = []
+        existing = self.tables.setdefault(table, [])
+        next_id = self.next_ids.get(table) or max((row.get("id") or 0 for row in existing), default=0) + 1
+        for row in rows:
+            row = dict(row)
+            if row.get("id") is None:
+                row["id"] = next_id
+            next_id = max(next_id, row["id"]) + 1
+            row.setdefault("created_at", datetime.utcnow().isoformat())
+            existing.append(row)
+            stored.append(dict(row))
+        self.next_ids[table] = next_id
+        self.persist(table)
+        return stored
+
+    def persist(self, table=None):
+        """Write tables through to the SQLite file when one is configured"""
+        if self.conn is None:
+            return
+        for name in [table] if table else list(self.tables):
+            self.conn.execute("delete from rows where tbl = ?", (name,))
+            self.conn.executemany("insert into rows (tbl, id, data) values (?, ?, ?)",
+                                  [(name, row["id"], json.dumps(row, default=str)) for row in self.tables[name]])
+        self.conn.commit()
+
+
+def create_fake_client(url, latency_ms=0):
+    """FakeClient for a memory:// or sqlite:///path URL"""
+    path = url[len("sqlite:///"):] if url.startswith("sqlite:///") else None
+    return FakeClient(path=path, latency_ms=latency_ms)
@@ -72,15 +72,14 @@ class FacebookAnalytics:
             return False
         
         try:
-            self.db.client.table("posts").update({
+            self.db.update_post_metrics(post_id, {
                 "reach": insights.get("reach", 0),
                 "impressions": insights.get("impressions", 0),
                 "engagements": insights.get("engagements", 0),
                 "reactions": insights.get("likes", 0),
                 "comments": insights.get("comments", 0),
                 "shares": insights.get("shares", 0),
-                "metrics_updated_at": datetime.utcnow().isoformat()
-            }).eq("facebook_post_id", post_id).execute()
+            })
             
             return True
         except Exception as e:
@@ -92,23 +91,21 @@ class FacebookAnalytics:
         try:
             cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
             
-            result = self.db.client.table("posts").select(
-                "id, facebook_post_id, content_id"
-            ).gte("posted_at", cutoff).execute()
-            
-            posts = result.data if result.data else []
+            posts = self.db.get_posts_since(cutoff, ["id", "facebook_post_id", "content_id"])
             
-            log_info(f"Updating metrics for {len(posts)} posts...")
+            log_info(f"Updating metrics for posts since {cutoff}...")
             
+            seen = 0
             updated = 0
             for post in posts:
+                seen += 1
                 fb_post_id = post.get("facebook_post_id")
                 if fb_post_id:
                     success = self.update_post_metrics(fb_post_id, post.get("content_id"))
                     if success:
                         updated += 1
             
-            log_success(f"Updated metrics for {updated}/{len(posts)} posts")
+            log_success(f"Updated metrics for {updated}/{seen} posts")
             return updated
             
         except Exception as e:
@@ -120,62 +117,48 @@ class FacebookAnalytics:
         try:
             cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
             
-            result = self.db.client.table("posts").select(
-                "id, post_language, target_country, niche, reach, impressions, engagements, reactions, comments, shares, posted_at"
-            ).gte("posted_at", cutoff).execute()
-            
-            posts = result.data if result.data else []
-            
-            if not posts:
-                return "No posts in the last {days} days"
+            posts = self.db.get_posts_since(cutoff, [
+                "id", "post_language", "target_country", "niche", "reach", "impressions",
+                "engagements", "reactions", "comments", "shares", "posted_at"
+            ])
             
-            # Aggregate by language
+            # Aggregate by language, country and niche in one pass over the stream
             lang_stats = {}
-            for post in posts:
-                lang = post.get("post_language", "unknown")
-                if lang not in lang_stats:
-                    lang_stats[lang] = {"posts": 0, "reach": 0, "engagements": 0}
-                lang_stats[lang]["posts"] += 1
-                lang_stats[lang]["reach"] += post.get("reach", 0) or 0
-                lang_stats[lang]["engagements"] += post.get("engagements", 0) or 0
-            
-            # Aggregate by country
             country_stats = {}
-            for post in posts:
-                country = post.get("target_country", "unknown")
-                if country not in country_stats:
-                    country_stats[country] = {"posts": 0, "reach": 0, "engagements": 0}
-                country_stats[country]["posts"] += 1
-                country_stats[country]["reach"] += post.get("reach", 0) or 0
-                country_stats[country]["engagements"] += post.get("engagements", 0) or 0
-            
-            # Aggregate by niche
             niche_stats = {}
+            totals = {"posts": 0, "reach": 0, "engagements": 0, "reactions": 0, "comments": 0, "shares": 0}
             for post in posts:
-                niche = post.get("niche", "unknown")
-                if niche not in niche_stats:
-                    niche_stats[niche] = {"posts": 0, "reach": 0, "engagements": 0}
-                niche_stats[niche]["posts"] += 1
-                niche_stats[niche]["reach"] += post.get("reach", 0) or 0
-                niche_stats[niche]["engagements"] += post.get("engagements", 0) or 0
+                reach = post.get("reach", 0) or 0
+                engagements = post.get("engagements", 0) or 0
+                for stats, key in ((lang_stats, post.get("post_language", "unknown")),
+                                   (country_stats, post.get("target_country", "unknown")),
+                                   (niche_stats, post.get("niche", "unknown"))):
+                    if key not in stats:
+                        stats[key] = {"posts": 0, "reach": 0, "engagements": 0}
+                    stats[key]["posts"] += 1
+                    stats[key]["reach"] += reach
+                    stats[key]["engagements"] += engagements
+                totals["posts"] += 1
+                for metric in ("reach", "engagements", "reactions", "comments", "shares"):
+                    totals[metric] += post.get(metric, 0) or 0
+            
+            if not totals["posts"]:
+                return "No posts in the last {days} days"
             
-            # Calculate totals
-            total_reach = sum(p.get("reach", 0) or 0 for p in posts)
-            total_engagements = sum(p.get("engagements", 0) or 0 for p in posts)
-            total_reactions = sum(p.get("reactions", 0) or 0 for p in posts)
-            total_comments = sum(p.get("comments", 0) or 0 for p in posts)
-            total_shares = sum(p.get("shares", 0) or 0 for p in posts)
+            total_posts = totals["posts"]
+            total_reach = totals["reach"]
+            total_engagements = totals["engagements"]
             
             report = {
                 "period_days": days,
-                "total_posts": len(posts),
+                "total_posts": total_posts,
                 "total_reach": total_reach,
                 "total_engagements": total_engagements,
-                "total_reactions": total_reactions,
-                "total_comments": total_comments,
-                "total_shares": total_shares,
-                "avg_reach_per_post": total_reach // len(posts) if posts else 0,
-                "avg_engagements_per_post": total_engagements // len(posts) if posts else 0,
+                "total_reactions": totals["reactions"],
+                "total_comments": totals["comments"],
+                "total_shares": totals["shares"],
+                "avg_reach_per_post": total_reach // total_posts,
+                "avg_engagements_per_post": total_engagements // total_posts,
                 "by_language": lang_stats,
                 "by_country": dict(sorted(country_stats.items(), key=lambda x: x[1]["reach"], reverse=True)[:10]),
                 "by_niche": niche_stats,
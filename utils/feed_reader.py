@@ -0,0 +1,128 @@
+import re
+import html as html_lib
+from io import BytesIO
+from urllib.parse import urljoin
+from lxml import etree
+from utils.http_helper import fetch_page
+from utils.logger import log_info, log_warning
+
+# Paths probed when the homepage doesn't advertise a feed
+FEED_PATHS = [
+    "/feed",
+    "/rss",
+    "/rss.xml",
+    "/feed.xml",
+    "/news-sitemap.xml",
+    "/sitemap-news.xml",
+    "/sitemap_news.xml",
+]
+
+FEED_LINK_RE = re.compile(
+    r'<link[^>]+type=["\']application/(?:rss|atom)\+xml["\'][^>]*>',
+    re.IGNORECASE
+)
+HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+TAG_RE = re.compile(r"<[^>]+>")
+
+# Namespaces are stripped from tags while parsing, so these are local names
+ITEM_TAGS = {"item", "entry", "url"}
+IMAGE_TAGS = {"content", "thumbnail", "enclosure"}
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _clean(text):
+    if not text:
+        return ""
+    return " ".join(html_lib.unescape(TAG_RE.sub(" ", text)).split())
+
+
+def _item_from_element(elem):
+    """Turn an RSS <item>, Atom <entry> or sitemap <url> into an article dict"""
+    item = {"headline": "", "summary": "", "url": "", "image": "", "published_at": ""}
+    for child in elem.iter():
+        if child is elem:
+            continue
+        name = _local(child.tag)
+        text = (child.text or "").strip()
+
+        if name == "title" and not item["headline"]:
+            item["headline"] = _clean(text)
+        elif name == "link" and not item["url"]:
+            # Atom puts the URL in href; RSS in the text
+            if child.get("rel", "alternate") == "alternate":
+                item["url"] = child.get("href") or text
+        elif name == "loc" and _local(child.getparent().tag) == "url":
+            item["url"] = text
+        elif name == "loc" and not item["image"]:
+            item["image"] = text  # image:image/image:loc in news sitemaps
+        elif name in ("description", "summary") and not item["summary"]:
+            item["summary"] = _clean(text)[:500]
+        elif name in ("pubDate", "published", "updated", "publication_date", "date") and not item["published_at"]:
+            item["published_at"] = text
+        elif name in IMAGE_TAGS and not item["image"]:
+            medium = child.get("medium") or child.get("type") or "image"
+            if child.get("url") and "image" in medium:
+                item["image"] = child.get("url")
+    return item
+
+
+def parse_feed(data, limit=15):
+    """
+    Stream-parse an RSS, Atom or news-sitemap document and return up to
+    `limit` article dicts. Elements are cleared as they are consumed, so
+    memory stays flat however large the feed is.
+    """
+    if not data:
+        return []
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    articles = []
+    try:
+        for _, elem in etree.iterparse(BytesIO(data), events=("end",), recover=True,
+                                       resolve_entities=False, no_network=True):
+            if _local(elem.tag) not in ITEM_TAGS:
+                continue
+            item = _item_from_element(elem)
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            if item["headline"] and item["url"]:
+                articles.append(item)
+                if len(articles) >= limit:
+                    break
+    except etree.XMLSyntaxError as e:
+        log_warning(f"Could not parse feed: {e}")
+    return articles
+
+
+def is_feed(data):
+    """Cheap sniff of the root element"""
+    head = (data[:1000] if isinstance(data, bytes) else data[:1000].encode("utf-8", "ignore")).lower()
+    return any(marker in head for marker in (b"<rss", b"<feed", b"<urlset", b"<rdf:rdf"))
+
+
+def discover_feed(site_url, homepage_html=None):
+    """
+    Find a feed for a site: <link rel="alternate"> on the homepage first,
+    then a handful of common paths. Returns the feed URL or "".
+    """
+    if homepage_html is None:
+        homepage_html = fetch_page(site_url) or ""
+
+    candidates = []
+    for link in FEED_LINK_RE.findall(homepage_html):
+        href = HREF_RE.search(link)
+        if href and "comments" not in href.group(1):
+            candidates.append(urljoin(site_url, html_lib.unescape(href.group(1))))
+    candidates += [site_url.rstrip("/") + path for path in FEED_PATHS]
+
+    for candidate in candidates:
+        data = fetch_page(candidate, max_retries=1, raw=True)
+        if data and is_feed(data) and parse_feed(data, limit=1):
+            log_info(f"Discovered feed for {site_url}: {candidate}")
+            return candidate
+    return ""
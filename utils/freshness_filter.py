@@ -1,6 +1,7 @@
 import re
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
+from utils.text_classifier import text_classifier
 
 class FreshnessFilter:
     """Filter articles to ensure they are recent (within last 48 hours)"""
@@ -30,16 +31,13 @@ class FreshnessFilter:
             return date_from_url >= self.cutoff_time.date()
         
         # Check headline/summary for date indicators
-        headline = article.get("headline", "").lower()
-        summary = article.get("summary", "").lower()
-        text = headline + " " + summary
+        text = article.get("headline", "") + " " + article.get("summary", "")
         
-        fresh_indicators = ["today", "aujourd'hui", "breaking", "just in", "vient de", "ce matin", "this morning"]
-        if any(indicator in text for indicator in fresh_indicators):
+        tags = text_classifier.classify(text)
+        if "fresh" in tags:
             return True
         
-        stale_indicators = ["last year", "l'an dernier", "2023", "2022", "2021", "2020"]
-        if any(indicator in text for indicator in stale_indicators):
+        if "stale" in tags:
             return False
         
         return True
@@ -29,8 +29,8 @@ def get_headers_for_url(url):
             return GOOGLEBOT_HEADERS
     return DEFAULT_HEADERS
 
-def fetch_page(url, timeout=15, max_retries=3):
-    """Fetch a web page with appropriate headers"""
+def fetch_page(url, timeout=15, max_retries=3, raw=False):
+    """Fetch a web page with appropriate headers (bytes instead of text if raw)"""
     headers = get_headers_for_url(url)
     
     for attempt in range(1, max_retries + 1):
@@ -43,7 +43,7 @@ def fetch_page(url, timeout=15, max_retries=3):
             )
             
             if response.status_code == 200:
-                return response.text
+                return response.content if raw else response.text
             elif response.status_code == 403:
                 log_warning(f"Access denied (403) for {url}")
                 return None
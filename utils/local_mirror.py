@@ -0,0 +1,189 @@
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from utils.logger import log_info, log_warning
+
+SCHEMA = """
+-- Content is no longer mirrored (claims must go to Supabase)
+drop table if exists content;
+
+create table if not exists posts (
+    id integer primary key,
+    facebook_post_id text,
+    post_language text,
+    image_used text,
+    posted_at text,
+    data text
+);
+create index if not exists posts_posted on posts (posted_at);
+create index if not exists posts_image on posts (image_used);
+create index if not exists posts_facebook on posts (facebook_post_id);
+
+-- Every image ever posted (posts above only keeps a recent window)
+create table if not exists used_images (
+    url text primary key
+);
+
+create table if not exists sync_state (
+    key text primary key,
+    value text
+);
+"""
+
+PAGE_SIZE = 1000
+# Re-read this many seconds before the watermark: writers' clocks and commit
+# order can differ slightly, and re-applying a row is harmless
+SYNC_OVERLAP = 5
+
+
+class LocalMirror:
+    """
+    SQLite copy of recent posts and of every image ever posted.
+
+    Reads are served locally; writes still go to Supabase and are applied
+    here afterwards. refresh() pulls only posts created or re-measured since
+    the last sync's watermark, and runs at most once per max_age seconds.
+    """
+
+    def __init__(self, path, max_age=60, post_days=8):
+        self.path = path
+        self.max_age = max_age
+        self.post_days = post_days
+        self.synced_at = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    # --- sync ---
+
+    def refresh(self, client):
+        """Delta-sync from Supabase when the mirror is older than max_age"""
+        if time.time() - self.synced_at < self.max_age:
+            return
+        with self.lock:
+            if time.time() - self.synced_at < self.max_age:
+                return
+            started = time.time()
+            new_posts = self._sync_posts(client)
+            self._load_used_images(client)
+            self._prune()
+            self.conn.commit()
+            self.synced_at = time.time()
+            log_info(f"Local mirror synced: {new_posts} new/updated posts ({time.time() - started:.2f}s)")
+
+    def _get_state(self, key):
+        row = self.conn.execute("select value from sync_state where key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_state(self, key, value):
+        self.conn.execute("insert or replace into sync_state (key, value) values (?, ?)", (key, value))
+
+    def _fetch_pages(self, query_for_page):
+        rows = []
+        start = 0
+        while True:
+            page = query_for_page().range(start, start + PAGE_SIZE - 1).execute().data or []
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                return rows
+            start += PAGE_SIZE
+
+    def _watermark(self, key):
+        """Stored watermark minus SYNC_OVERLAP, or None before the first sync"""
+        cursor = self._get_state(key)
+        if not cursor:
+            return None
+        stamp = datetime.fromisoformat(cursor.replace("Z", "+00:00")) - timedelta(seconds=SYNC_OVERLAP)
+        return stamp.isoformat()
+
+    def _sync_posts(self, client):
+        """New posts, and posts whose metrics were refreshed, since the last sync"""
+        cursor = self._watermark("posts_synced_at")
+        if cursor:
+            changed = f"posted_at.gt.{cursor},metrics_updated_at.gt.{cursor}"
+        else:
+            window = (datetime.utcnow() - timedelta(days=self.post_days)).isoformat()
+            changed = f"posted_at.gte.{window}"
+        rows = self._fetch_pages(lambda: client.table("posts").select("*").or_(changed).order("id"))
+        for row in rows:
+            self.upsert_post(row)
+        if rows:
+            stamps = [row.get(key) for row in rows for key in ("posted_at", "metrics_updated_at")]
+            self._set_state("posts_synced_at", max(stamp for stamp in stamps if stamp))
+        return len(rows)
+
+    def _load_used_images(self, client):
+        """One-off load of every image_used ever posted; upsert_post keeps it current"""
+        if self._get_state("used_images_loaded"):
+            return
+        rows = self._fetch_pages(lambda: client.table("posts").select("id, image_used")
+                                 .neq("image_used", "").order("id"))
+        self.conn.executemany("insert or ignore into used_images (url) values (?)",
+                              [(row["image_used"],) for row in rows if row.get("image_used")])
+        self._set_state("used_images_loaded", datetime.utcnow().isoformat())
+
+    def _prune(self):
+        post_cutoff = (datetime.utcnow() - timedelta(days=self.post_days)).isoformat()
+        self.conn.execute("delete from posts where posted_at < ?", (post_cutoff,))
+
+    # --- write-through ---
+
+    def upsert_post(self, row):
+        if not row or row.get("id") is None:
+            return
+        self.conn.execute(
+            "insert or replace into posts (id, facebook_post_id, post_language, image_used, posted_at, data) "
+            "values (?, ?, ?, ?, ?, ?)",
+            (row["id"], row.get("facebook_post_id"), row.get("post_language"), row.get("image_used"),
+             row.get("posted_at"), json.dumps(row))
+        )
+        if row.get("image_used"):
+            self.conn.execute("insert or ignore into used_images (url) values (?)", (row["image_used"],))
+
+    def update_post(self, facebook_post_id, fields):
+        rows = self.conn.execute("select id, data from posts where facebook_post_id = ?", (facebook_post_id,)).fetchall()
+        for row in rows:
+            data = json.loads(row["data"])
+            data.update(fields)
+            self.conn.execute("update posts set data = ? where id = ?", (json.dumps(data), row["id"]))
+
+    def commit(self):
+        self.conn.commit()
+
+    # --- reads ---
+
+    def posts_since(self, cutoff, columns=None):
+        rows = self.conn.execute("select data from posts where posted_at >= ? order by posted_at", (cutoff,))
+        posts = [json.loads(row["data"]) for row in rows]
+        if columns:
+            posts = [{column: post.get(column) for column in columns} for post in posts]
+        return posts
+
+    def image_used(self, image_url):
+        return self.conn.execute("select 1 from used_images where url = ?", (image_url,)).fetchone() is not None
+
+    def covers(self, cutoff):
+        """True when the mirrored post window reaches back to cutoff"""
+        window = (datetime.utcnow() - timedelta(days=self.post_days)).isoformat()
+        return cutoff >= window
+
+
+_mirror = None
+_mirror_lock = threading.Lock()
+
+
+def get_mirror(path, **options):
+    """The process-wide mirror for path, or None if it can't be opened"""
+    global _mirror
+    if _mirror is None:
+        with _mirror_lock:
+            if _mirror is None:
+                try:
+                    _mirror = LocalMirror(path, **options)
+                except sqlite3.Error as e:
+                    log_warning(f"Local mirror disabled, could not open {path}: {e}")
+                    _mirror = False
+    return _mirror or None
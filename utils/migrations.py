@@ -0,0 +1,141 @@
+"""
+Applies the versioned SQL files in migrations/ in filename order, recording
+each one in schema_migrations so it runs once.
+
+Targets a Postgres URL (the Supabase connection string, via psycopg or
+psycopg2) or sqlite:///path for local testing. On SQLite, Postgres-only
+files (marked "-- postgres-only": database functions) are recorded but
+skipped, and a few Postgres spellings are translated.
+"""
+import os
+import re
+import sqlite3
+from utils.logger import log_info, log_success, log_warning
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations")
+POSTGRES_ONLY = "-- postgres-only"
+
+SQLITE_REWRITES = [
+    (re.compile(r"bigint generated by default as identity primary key", re.I), "integer primary key autoincrement"),
+    (re.compile(r"now\(\)", re.I), "current_timestamp"),
+]
+ADD_COLUMN_RE = re.compile(r"alter table (\w+) add column if not exists (\w+) (.+)", re.I | re.S)
+
+
+def list_migrations(folder=MIGRATIONS_DIR):
+    """[(version, path)] sorted by filename; version is the file name without .sql"""
+    names = sorted(name for name in os.listdir(folder) if name.endswith(".sql"))
+    return [(name[:-4], os.path.join(folder, name)) for name in names]
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _statements(sql):
+    """Split a file with no function bodies into statements, dropping comments"""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+class PostgresTarget:
+    def __init__(self, url):
+        try:
+            import psycopg
+            self.conn = psycopg.connect(url)
+        except ImportError:
+            import psycopg2
+            self.conn = psycopg2.connect(url)
+
+    def applied(self):
+        with self.conn.cursor() as cur:
+            cur.execute("create table if not exists schema_migrations "
+                        "(version text primary key, applied_at timestamptz default now())")
+            cur.execute("select version from schema_migrations")
+            versions = {row[0] for row in cur.fetchall()}
+        self.conn.commit()
+        return versions
+
+    def apply(self, version, sql):
+        # Whole file in one transaction; plpgsql bodies make statement splitting unsafe
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(sql)
+                cur.execute("insert into schema_migrations (version) values (%s)", (version,))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return True
+
+    def close(self):
+        self.conn.close()
+
+
+class SqliteTarget:
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+
+    def applied(self):
+        self.conn.execute("create table if not exists schema_migrations "
+                          "(version text primary key, applied_at text default current_timestamp)")
+        return {row[0] for row in self.conn.execute("select version from schema_migrations")}
+
+    def _columns(self, table):
+        return {row[1] for row in self.conn.execute(f"pragma table_info({table})")}
+
+    def apply(self, version, sql):
+        ran = not sql.lstrip().lower().startswith(POSTGRES_ONLY)
+        try:
+            if ran:
+                for statement in _statements(sql):
+                    for pattern, replacement in SQLITE_REWRITES:
+                        statement = pattern.sub(replacement, statement)
+                    add_column = ADD_COLUMN_RE.match(statement)
+                    if add_column:
+                        table, column, definition = add_column.groups()
+                        if column in self._columns(table):
+                            continue
+                        statement = f"alter table {table} add column {column} {definition}"
+                    self.conn.execute(statement)
+            self.conn.execute("insert into schema_migrations (version) values (?)", (version,))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return ran
+
+    def close(self):
+        self.conn.close()
+
+
+def connect(url):
+    if url.startswith("sqlite:///"):
+        return SqliteTarget(url[len("sqlite:///"):])
+    if url.startswith(("postgres://", "postgresql://")):
+        return PostgresTarget(url)
+    raise ValueError("Migration target must be a postgres:// or sqlite:/// URL")
+
+
+def migrate(url, folder=MIGRATIONS_DIR):
+    """Apply every migration not yet recorded in the target. Returns the versions applied."""
+    target = connect(url)
+    try:
+        done = target.applied()
+        applied = []
+        for version, path in list_migrations(folder):
+            if version in done:
+                continue
+            if target.apply(version, _read(path)):
+                log_info(f"Applied migration {version}")
+            else:
+                log_warning(f"Skipped Postgres-only migration {version} on SQLite")
+            applied.append(version)
+        if applied:
+            log_success(f"{len(applied)} migration(s) applied")
+        else:
+            log_info("Schema is up to date")
+        return applied
+    finally:
+        target.close()
@@ -0,0 +1,83 @@
+"""
+Python versions of the database functions in migrations/, for running
+against a local stand-in instead of Supabase. Each takes the stand-in's
+tables ({name: [row dicts]}) and the RPC params, and must be called while
+the caller holds the stand-in's write lock, which gives the same
+atomicity the SQL versions get from row locks. They stamp content.updated_at
+the way the Postgres trigger (migrations/007) does.
+"""
+from datetime import datetime, timedelta
+
+
+def _now():
+    return datetime.utcnow().isoformat()
+
+
+def claim_content(tables, params):
+    now = _now()
+    filters = {
+        "country_code": params.get("p_country_code"),
+        "source_language": params.get("p_language"),
+        "niche": params.get("p_niche"),
+    }
+    candidates = [
+        row for row in tables.get("content", [])
+        if row.get("status") == "pending"
+        and (not row.get("claimed_until") or row["claimed_until"] < now)
+        and all(value is None or row.get(column) == value for column, value in filters.items())
+    ]
+    if not candidates:
+        return []
+    row = max(candidates, key=lambda candidate: candidate["id"])
+    lease = timedelta(seconds=params.get("lease_seconds", 600))
+    row["claimed_by"] = params["worker"]
+    row["claimed_until"] = (datetime.utcnow() + lease).isoformat()
+    row["updated_at"] = now
+    return [dict(row)]
+
+
+def commit_post(tables, params):
+    posts = tables.setdefault("posts", [])
+    post = next((row for row in posts if row.get("facebook_post_id") == params["p_facebook_post_id"]), None)
+    if post is None:
+        post = {
+            "id": max((row.get("id") or 0 for row in posts), default=0) + 1,
+            "content_id": params["p_content_id"],
+            "post_text": params["p_post_text"],
+            "post_language": params["p_post_language"],
+            "target_country": params["p_target_country"],
+            "niche": params["p_niche"],
+            "image_used": params["p_image_used"],
+            "facebook_post_id": params["p_facebook_post_id"],
+            "posted_at": _now(),
+        }
+        posts.append(post)
+    for row in tables.get("content", []):
+        if row.get("id") == params["p_content_id"]:
+            row.update({"status": "posted", "claimed_by": None, "claimed_until": None, "updated_at": _now()})
+    return dict(post)
+
+
+def dashboard_stats(tables, params):
+    since = params["since"]
+    content = tables.get("content", [])
+    posts = [row for row in tables.get("posts", []) if (row.get("posted_at") or "") >= since]
+    by_language = {}
+    for row in posts:
+        by_language[row.get("post_language")] = by_language.get(row.get("post_language"), 0) + 1
+    by_status = {}
+    for row in content:
+        by_status[row.get("status")] = by_status.get(row.get("status"), 0) + 1
+    return {
+        "pending": by_status.get("pending", 0),
+        "posts_today": len(posts),
+        "posts_by_language": by_language,
+        "content_by_status": by_status,
+    }
+
+
+RPC_STANDINS = {
+    "claim_content": claim_content,
+    "commit_post": commit_post,
+    "dashboard_stats": dashboard_stats,
+}
@@ -0,0 +1,93 @@
+import re
+import json
+
+# JSON-LD blocks are located with a regex so pages without them cost no DOM parse
+LD_JSON_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+ARTICLE_TYPES = {"NewsArticle", "Article", "BlogPosting", "ReportageNewsArticle",
+                 "AnalysisNewsArticle", "OpinionNewsArticle"}
+
+
+def _iter_nodes(data):
+    """Yield every JSON-LD object, flattening lists, @graph and ItemList entries"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        for key in ("@graph", "itemListElement", "item", "mainEntity"):
+            if key in data:
+                yield from _iter_nodes(data[key])
+
+
+def _types(node):
+    types = node.get("@type", [])
+    return set(types) if isinstance(types, list) else {types}
+
+
+def _first_url(value):
+    """schema.org image/url values can be a string, a list or an ImageObject"""
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        value = value.get("url") or value.get("contentUrl") or value.get("@id") or ""
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _text(value):
+    return " ".join(value.split()) if isinstance(value, str) else ""
+
+
+def extract_json_ld(html):
+    """Return all decoded JSON-LD objects in a page"""
+    if not html or "ld+json" not in html:
+        return []
+    nodes = []
+    for block in LD_JSON_RE.findall(html):
+        try:
+            data = json.loads(block.strip())
+        except ValueError:
+            # Some CMSs emit trailing commas or raw newlines; skip those blocks
+            continue
+        nodes.extend(_iter_nodes(data))
+    return nodes
+
+
+def extract_news_articles(html):
+    """
+    Extract NewsArticle-like entries from a page's JSON-LD.
+    Returns dicts with headline, url, image, published_at, summary and
+    body (articleBody, usually only on article pages).
+    """
+    articles = []
+    seen = set()
+    for node in extract_json_ld(html):
+        if not _types(node) & ARTICLE_TYPES:
+            continue
+        headline = _text(node.get("headline") or node.get("name"))
+        url = _first_url(node.get("url") or node.get("mainEntityOfPage"))
+        if not headline or (url and url in seen):
+            continue
+        if url:
+            seen.add(url)
+        articles.append({
+            "headline": headline,
+            "url": url,
+            "image": _first_url(node.get("image") or node.get("thumbnailUrl")),
+            "published_at": node.get("datePublished") or node.get("dateCreated") or "",
+            "summary": _text(node.get("description")),
+            "body": node.get("articleBody") if isinstance(node.get("articleBody"), str) else "",
+        })
+    return articles
+
+
+def extract_article_metadata(html):
+    """The main NewsArticle on an article page, or None"""
+    articles = extract_news_articles(html)
+    if not articles:
+        return None
+    # Related-article teasers can be listed too; the main one carries the body/image
+    return next((a for a in articles if a["body"] or a["image"]), articles[0])
@@ -0,0 +1,87 @@
+import os
+import json
+import hashlib
+import time
+import threading
+from config.settings import SUPABASE_URL
+from utils.logger import log_warning
+
+CACHE_PATH = os.getenv("TABLE_CACHE_PATH", os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache", "tables.json"))
+# Bump when the shape of cached values changes so stale files are ignored
+CACHE_VERSION = 1
+# A file written against another database (or the offline stand-in) is ignored too
+CACHE_STAMP = f"{CACHE_VERSION}:{hashlib.sha256((SUPABASE_URL or '').encode()).hexdigest()[:12]}"
+
+
+def _dump(value):
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class TableCache:
+    """
+    TTL cache for small, slowly changing query results (sources, schedule).
+    Entries live in memory for the daemon and are mirrored to a JSON file so
+    a fresh CI process can start warm. Files with another CACHE_STAMP are
+    discarded.
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("stamp") == CACHE_STAMP:
+                return data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _write(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"stamp": CACHE_STAMP, "entries": self.entries}, f, default=str)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log_warning(f"Could not persist table cache to {self.path}: {e}")
+
+    def get(self, key, ttl, load):
+        """Cached value for key if younger than ttl seconds, else load() and store it"""
+        entry = self.entries.get(key)
+        if entry and time.time() - entry["stored_at"] < ttl:
+            return entry["value"]
+        value = load()
+        with self.lock:
+            changed = entry is None or _dump(entry["value"]) != _dump(value)
+            self.entries[key] = {"stored_at": time.time(), "value": value}
+            # An unchanged reload only renews the entry in memory; the file (and the
+            # CI cache keyed on its hash) is rewritten only when the data changed
+            if changed:
+                self._write()
+        return value
+
+    def update(self, key, change):
+        """Apply change(value) to a cached value in place after a local write"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                before = _dump(entry["value"])
+                change(entry["value"])
+                if _dump(entry["value"]) != before:
+                    self._write()
+
+    def invalidate(self, key=None):
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+            self._write()
+
+
+table_cache = TableCache()
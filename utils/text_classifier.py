@@ -0,0 +1,145 @@
+from collections import deque
+from config.settings import TIER_1_COUNTRIES, TIER_2_COUNTRIES, COUNTRY_ALIASES, NICHE_KEYWORDS
+
+# Anchor texts that are navigation/UI rather than headlines
+LINK_BOILERPLATE = [
+    "cookie", "privacy", "subscribe", "contact", "menu",
+    "lire la suite", "read more", "en savoir plus", "aller au contenu",
+    "newsletter", "login", "sign in", "recherche", "abonnez",
+    "recevez", "suivez", "partager"
+]
+
+# Paragraph texts that are page chrome rather than article body. Matched as
+# whole words: body text is full of "public", "publié", "République"...
+BODY_BOILERPLATE = [
+    "cookie", "cookies", "subscribe", "copyright", "fm:",
+    "publicité", "publireportage", "publi-reportage", "sponsored", "contenu sponsorisé",
+    "tous droits réservés", "all rights reserved"
+]
+
+FRESH_INDICATORS = ["today", "aujourd'hui", "breaking", "just in", "vient de", "ce matin", "this morning"]
+STALE_INDICATORS = ["last year", "l'an dernier", "2023", "2022", "2021", "2020"]
+
+
+class MultiPatternMatcher:
+    """
+    Aho-Corasick automaton over lowercase patterns. All patterns are found
+    in a single left-to-right pass regardless of how many there are.
+    Patterns flagged whole_word only match between non-alphanumeric chars.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        self.built = False
+
+    def add(self, pattern, payload, whole_word=False):
+        state = 0
+        for char in pattern.lower():
+            nxt = self.goto[state].get(char)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][char] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = nxt
+        self.output[state].append((len(pattern), payload, whole_word))
+        self.built = False
+
+    def build(self):
+        # Breadth-first so every fail target is final before it is used
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(char, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+        self.built = True
+
+    def iter_matches(self, text):
+        """Yield (start, payload) for every match in lowercase text, in end-position order"""
+        if not self.built:
+            self.build()
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, payload, whole_word in output[state]:
+                start = end - length + 1
+                if whole_word and (
+                    (start > 0 and text[start - 1].isalnum()) or
+                    (end + 1 < len(text) and text[end + 1].isalnum())
+                ):
+                    continue
+                yield start, payload
+
+
+class TextClassifier:
+    """
+    One shared matcher for country, niche, boilerplate and freshness tagging.
+    Every pattern lives in a single automaton, so classifying a string is a
+    single pass over it.
+    """
+
+    def __init__(self):
+        self.matcher = MultiPatternMatcher()
+        for country in TIER_1_COUNTRIES + TIER_2_COUNTRIES:
+            self.matcher.add(country["name"].lower(), ("country", (country["name"], country["code"])), True)
+        for keyword, country in COUNTRY_ALIASES.items():
+            self.matcher.add(keyword, ("country", country), True)
+        for niche, keywords in NICHE_KEYWORDS.items():
+            for keyword in keywords:
+                self.matcher.add(keyword, ("niche", niche), True)
+        for pattern in BODY_BOILERPLATE:
+            self.matcher.add(pattern, ("body_boilerplate", pattern), True)
+        # Link boilerplate and freshness lists have always been plain substring checks
+        for category, patterns in (("link_boilerplate", LINK_BOILERPLATE),
+                                   ("fresh", FRESH_INDICATORS),
+                                   ("stale", STALE_INDICATORS)):
+            for pattern in patterns:
+                self.matcher.add(pattern, (category, pattern))
+        self.matcher.build()
+
+    def classify(self, text):
+        """Return {category: [values in order of first appearance]} for text"""
+        result = {}
+        if not text:
+            return result
+        for _, (category, value) in sorted(self.matcher.iter_matches(text.lower()), key=lambda m: m[0]):
+            values = result.setdefault(category, [])
+            if value not in values:
+                values.append(value)
+        return result
+
+    def has(self, text, category):
+        """True as soon as any pattern of the category matches"""
+        if not text:
+            return False
+        for _, (found, _) in self.matcher.iter_matches(text.lower()):
+            if found == category:
+                return True
+        return False
+
+    def match_country(self, text):
+        """(name, code) of the first country mentioned, or None"""
+        countries = self.classify(text).get("country")
+        return countries[0] if countries else None
+
+    def match_niche(self, text):
+        """Niche with the most keyword hits, or None"""
+        counts = {}
+        for _, (category, value) in self.matcher.iter_matches((text or "").lower()):
+            if category == "niche":
+                counts[value] = counts.get(value, 0) + 1
+        return max(counts, key=counts.get) if counts else None
+
+
+text_classifier = TextClassifier()